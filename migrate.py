@@ -0,0 +1,76 @@
+import streamlit as st
+
+try:
+    # Root secrets are exported as environment variables once read, as when the dashboard runs
+    len(st.secrets)
+except FileNotFoundError:
+    # No secrets file, the environment variables are set directly
+    pass
+
+from src.model.DevilFruit import DevilFruit
+from src.model.ImpelDownLog import ImpelDownLog
+from src.model.ImpelDownLogArchive import ImpelDownLogArchive
+from src.model.Prediction import Prediction
+from src.model.User import User
+from src.model.Warlord import Warlord
+from src.model.enums.UserTimer import UserTimer
+from src.service.db_service import ensure_index, ensure_column, ensure_full_text_index
+
+
+def main() -> None:
+    """
+    Creates the columns and indexes used by the dashboard on the tables of the bot.
+    Run once on deploy, before starting the dashboard, and again after any change to this file.
+    Existing columns and indexes are skipped, and the others are added online, so the bot keeps running
+    :return: None
+    """
+
+    # User
+    ensure_index(User, "user_tg_username", ["tg_username"])
+    ensure_index(User, "user_last_message_date", ["last_message_date", "id"])
+    ensure_index(User, "user_last_system_interaction_date", ["last_system_interaction_date"])
+    ensure_index(User, "user_join_date_last_message_date", ["join_date", "last_message_date"])
+    ensure_index(User, "user_bounty", ["bounty"])
+    ensure_index(User, "user_crew_bounty", ["crew_id", "bounty"])
+    ensure_index(User, "user_location_level_bounty", ["location_level", "bounty"])
+    ensure_index(User, "user_is_active_location_level", ["is_active", "location_level"])
+    ensure_index(User, "user_is_admin", ["is_admin"])
+    ensure_index(User, "user_impel_down_release_date", ["impel_down_release_date", "id"])
+    ensure_index(User, "user_impel_down_is_permanent", ["impel_down_is_permanent", "id"])
+    for user_timer in UserTimer:
+        ensure_index(User, f"user_{user_timer}", [user_timer, "id"])
+    ensure_full_text_index(User, "user_search_ngram", ["tg_first_name", "tg_last_name", "tg_username"])
+
+    # Devil Fruit
+    ensure_index(DevilFruit, "devil_fruit_owner_collection_date", ["owner_id", "collection_date", "id"])
+    ensure_index(DevilFruit, "devil_fruit_owner_eaten_date", ["owner_id", "eaten_date", "id"])
+
+    # Impel Down logs, recent and archived
+    for log_model in [ImpelDownLog, ImpelDownLogArchive]:
+        table_name = log_model._meta.table_name
+        ensure_index(log_model, f"{table_name}_user_date_time", ["user_id", "date_time", "id"])
+        ensure_index(log_model, f"{table_name}_date_time", ["date_time", "id"])
+        ensure_index(log_model, f"{table_name}_source_date_time", ["source", "date_time"])
+        ensure_index(log_model, f"{table_name}_bounty_action", ["bounty_action", "id"])
+        ensure_index(log_model, f"{table_name}_sentence_type", ["sentence_type", "id"])
+        ensure_full_text_index(log_model, f"{table_name}_reason_ngram", ["reason"])
+
+    # Prediction
+    # Normalised question hash, compact enough to be indexed instead of the question itself. Not unique, as the bot
+    # saves predictions too and questions that only differ by case or spaces may already exist. Virtual, so that it is
+    # added without copying the table
+    ensure_column(Prediction, "question_hash", "BINARY(16) AS (UNHEX(MD5(LOWER(TRIM(question))))) VIRTUAL")
+    ensure_index(Prediction, "prediction_question_hash", ["question_hash"])
+    # Set by the dashboard when the results are sent to the bot, so that they are sent only once
+    ensure_column(Prediction, "results_requested_date", "DATETIME NULL")
+    ensure_index(Prediction, "prediction_status", ["status", "id"])
+    ensure_full_text_index(Prediction, "prediction_question_ngram", ["question"])
+
+    # Warlord
+    ensure_index(Warlord, "warlord_date", ["date", "id"])
+    ensure_index(Warlord, "warlord_user_date", ["user_id", "date", "id"])
+    ensure_index(Warlord, "warlord_user_end_date", ["user_id", "end_date", "id"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import datetime
+
+import streamlit as st
+
+import constants as c
+from pages.commons.util import get_paginated, show_page_navigation, reset_page_cursor
+from src.model.User import User
+from src.model.enums.UserTimer import UserTimer
+from src.service.cooldown_service import get_users_with_running_timer, get_timer_field, \
+    count_users_with_running_timer
+from src.service.date_service import get_remaining_times_in_seconds, format_durations
+
+
+def main():
+    """
+    Main function
+    :return:
+    """
+
+    st.title("Cooldowns")
+    st.markdown(c.HIDE_ST_STYLE, unsafe_allow_html=True)
+
+    key_suffix = "_cooldowns"
+
+    col_timer, col_ends_within = st.columns(2)
+    timer: UserTimer = UserTimer.get_by_description(
+        col_timer.selectbox("Timer", UserTimer.get_all_description(), key=f"timer{key_suffix}",
+                            on_change=reset_page_cursor, args=[key_suffix]))
+
+    # Ending within, 0 for all running timers
+    ends_within_hours = col_ends_within.number_input(
+        "Ending within hours", min_value=0, value=0, key=f"ends_within{key_suffix}", on_change=reset_page_cursor,
+        args=[key_suffix], help="0 to show all running timers")
+    ends_within = datetime.timedelta(hours=ends_within_hours) if ends_within_hours > 0 else None
+
+    query = get_users_with_running_timer(timer, ends_within)
+    st.metric("Users", "{0:,}".format(count_users_with_running_timer(timer, ends_within)))
+
+    field = get_timer_field(timer)
+    page = get_paginated(query, field, key_suffix, ascending=True)
+    users: list[User] = page.items
+
+    end_dates = [getattr(user, field.name) for user in users]
+    remaining_times = format_durations(get_remaining_times_in_seconds(end_dates))
+    st.dataframe([{"User": user.get_display_name(add_user_id=True), "Ends": end_date, "Remaining": remaining_time}
+                  for user, end_date, remaining_time in zip(users, end_dates, remaining_times)],
+                 use_container_width=True)
+
+    show_page_navigation(page, key_suffix)
+
+
+main()
@@ -2,8 +2,14 @@ import streamlit as st
 from streamlit_option_menu import option_menu
 
 import constants as c
+from pages.commons.util import get_paginated, show_page_navigation, reset_page_cursor, get_search_key
+from pages.users.filter import show_and_get_user_filter
 from pages.users.impel_down import main as impel_down_main
+from pages.users.timeline import main as timeline_main
 from src.model.User import User
+from src.model.projection.UserListRow import UserListRow
+from src.service.user_search_service import search_users
+from src.service.user_service import get_status_badges
 
 
 def main():
@@ -18,36 +24,60 @@ def main():
     key_suffix = "_users"
 
     # Filter users by first name, last name, username or user id inputted
-    filter_by = st.text_input(label="Search", key=f"filter_by{key_suffix}")
+    filter_by = st.text_input(label="Search", key=f"filter_by{key_suffix}", on_change=reset_page_cursor,
+                              args=[key_suffix])
 
-    # Filter users limit 10
+    # Filter users limit 10, else browse the users matching the facets
+    page = None
     if len(filter_by) > 1:
-        users: list[User] = User.get_by_string_filter(filter_by)
+        users: list[UserListRow] = search_users(filter_by, get_search_key(key_suffix))
     else:
-        users: list[User] = User.select().order_by(User.last_message_date.desc()).limit(10)
+        user_filter = show_and_get_user_filter(key_suffix)
+        query = UserListRow.from_query(user_filter.apply(User.select()))
 
-    for index, user in enumerate(users):
-        expander_text = user.get_display_name()
+        # All users by last message date, filtered users by bounty to follow the composite indexes
+        if user_filter.is_empty():
+            page = get_paginated(query, User.last_message_date, key_suffix)
+        else:
+            page = get_paginated(query, User.bounty, key_suffix)
+        users: list[UserListRow] = page.items
+
+    users = list(users)
+    badges: dict[int, list[str]] = get_status_badges(users)
+
+    for user_row in users:
+        expander_text = " · ".join([user_row.get_display_name()] + badges[user_row.id])
 
         with st.expander(expander_text):
             # Basic information
             col_user_id, col_bounty = st.columns(2)
-            col_user_id.text_input("User ID", value=user.tg_user_id, disabled=True,
-                                   key=f"user_id_{index}{key_suffix}")
-            col_bounty.text_input("Bounty", value=user.get_bounty_formatted(), disabled=True,
-                                  key=f"bounty_{index}{key_suffix}")
+            col_user_id.text_input("User ID", value=user_row.tg_user_id, disabled=True,
+                                   key=f"user_id_{user_row.id}{key_suffix}")
+            col_bounty.text_input("Bounty", value=user_row.get_bounty_formatted(), disabled=True,
+                                  key=f"bounty_{user_row.id}{key_suffix}")
+
+            # Load the full user only when managing it
+            if not st.checkbox("Manage", key=f"manage_{user_row.id}{key_suffix}"):
+                continue
+
+            user: User = User.get_by_id(user_row.id)
 
             # Option Menu
             selected_option_menu = option_menu(
                 menu_title=None,
-                options=["Impel Down"],
-                icons=["shield-lock"],  # https://icons.getbootstrap.com/
+                options=["Impel Down", "Timeline"],
+                icons=["shield-lock", "clock-history"],  # https://icons.getbootstrap.com/
                 orientation="horizontal",
-                key=f"option_menu_{index}{key_suffix}"
+                key=f"option_menu_{user.id}{key_suffix}"
             )
 
             if selected_option_menu == "Impel Down":
                 impel_down_main(user)
+            elif selected_option_menu == "Timeline":
+                timeline_main(user)
+
+    if page is not None:
+        show_page_navigation(page, key_suffix)
 
 
 main()
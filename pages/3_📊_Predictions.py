@@ -3,6 +3,7 @@ from streamlit_option_menu import option_menu
 
 import constants as c
 from pages.predictions.add import main as add_main
+from pages.predictions.import_file import main as import_main
 from pages.predictions.list import main as list_main
 
 
@@ -17,8 +18,8 @@ def main():
 
     selected = option_menu(
         menu_title=None,
-        options=["Add", "List"],
-        icons=["plus-square", "list-ul"],  # https://icons.getbootstrap.com/
+        options=["Add", "List", "Import"],
+        icons=["plus-square", "list-ul", "upload"],  # https://icons.getbootstrap.com/
         orientation="horizontal",
     )
 
@@ -26,6 +27,8 @@ def main():
         add_main()
     elif selected == "List":
         list_main()
+    elif selected == "Import":
+        import_main()
 
 
 main()
@@ -0,0 +1,50 @@
+import streamlit as st
+
+import constants as c
+from pages.commons.util import select_user_select_box, get_selected_user
+from src.model.Crew import Crew
+from src.model.projection.UserListRow import UserListRow
+from src.service.leaderboard_service import get_top_users, get_sorted_bounties, get_rank
+
+
+def main():
+    """
+    Main function
+    :return:
+    """
+
+    st.title("Leaderboard")
+    st.markdown(c.HIDE_ST_STYLE, unsafe_allow_html=True)
+
+    key_suffix = "_leaderboard"
+
+    # Crew filter
+    crews: list[Crew] = list(Crew.select(Crew.id, Crew.name).where(Crew.is_active == True).order_by(Crew.name))
+    col_crew, col_count = st.columns(2)
+    crew_name = col_crew.selectbox("Crew", ["All"] + [crew.name for crew in crews], key=f"crew{key_suffix}")
+    crew_id = next((crew.id for crew in crews if crew.name == crew_name), None)
+
+    # Top users by bounty
+    count = col_count.number_input("Top", min_value=1, max_value=100, value=10, key=f"count{key_suffix}")
+    top_users: list[UserListRow] = get_top_users(count, crew_id)
+    st.dataframe([{"Rank": index + 1, "User": user.get_display_name(), "Bounty": user.get_bounty_formatted()}
+                  for index, user in enumerate(top_users)], use_container_width=True)
+
+    # Rank of any user
+    st.subheader("Rank lookup")
+    selected_user_display_name, users_display_name_map = select_user_select_box(key_suffix)
+    selected_user: UserListRow = get_selected_user(selected_user_display_name, users_display_name_map)
+
+    if selected_user:
+        if crew_id is not None and selected_user.crew_id != crew_id:
+            st.warning(f"User is not a member of {crew_name}")
+            return
+
+        rank, percentile = get_rank(selected_user.bounty, get_sorted_bounties(crew_id))
+        col_rank, col_percentile = st.columns(2)
+        col_rank.metric("Rank", f"#{rank:,}")
+        col_percentile.metric("Higher bounty than", f"{percentile:.2f}% of users")
+        st.caption("Ranks are refreshed every few minutes")
+
+
+main()
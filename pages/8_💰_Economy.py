@@ -0,0 +1,31 @@
+import streamlit as st
+from streamlit_option_menu import option_menu
+
+import constants as c
+from pages.economy.bulk_adjustment import main as bulk_adjustment_main
+from pages.economy.distribution import main as distribution_main
+
+
+def main():
+    """
+    Main function
+    :return:
+    """
+
+    st.title("Economy")
+    st.markdown(c.HIDE_ST_STYLE, unsafe_allow_html=True)
+
+    selected = option_menu(
+        menu_title=None,
+        options=["Distribution", "Bulk Adjustment"],
+        icons=["bar-chart", "sliders"],  # https://icons.getbootstrap.com/
+        orientation="horizontal",
+    )
+
+    if selected == "Distribution":
+        distribution_main()
+    elif selected == "Bulk Adjustment":
+        bulk_adjustment_main()
+
+
+main()
@@ -0,0 +1,47 @@
+import altair as alt
+import pandas as pd
+import streamlit as st
+
+import constants as c
+from src.service.activity_service import get_active_users_counts, get_activity_heatmap, get_join_cohorts, WEEKDAYS
+
+PERIODS_DAYS = {"Last 7 days": 7, "Last 30 days": 30, "Last 90 days": 90}
+
+
+def main():
+    """
+    Main function
+    :return:
+    """
+
+    st.title("Activity")
+    st.markdown(c.HIDE_ST_STYLE, unsafe_allow_html=True)
+
+    key_suffix = "_activity"
+
+    # Active users
+    for description, counts in get_active_users_counts().items():
+        st.subheader(description)
+        for col, (name, count) in zip(st.columns(len(counts)), counts.items()):
+            col.metric(name, "{0:,}".format(count))
+
+    period = st.radio("Period", list(PERIODS_DAYS.keys()), horizontal=True, key=f"period{key_suffix}")
+    days = PERIODS_DAYS[period]
+
+    # Weekday and hour heatmap
+    st.subheader("Last message time")
+    heatmap = pd.DataFrame(get_activity_heatmap(days), columns=["Weekday", "Hour", "Users"])
+    st.altair_chart(alt.Chart(heatmap).mark_rect().encode(
+        x=alt.X("Hour:O"), y=alt.Y("Weekday:O", sort=WEEKDAYS), color="Users:Q", tooltip=["Weekday", "Hour", "Users"]),
+        use_container_width=True)
+
+    # Join cohorts
+    st.subheader("Join cohorts")
+    st.caption(f"Users who joined in each month and sent a message in the {period.lower()}")
+    cohorts = pd.DataFrame(get_join_cohorts(days), columns=["Month", "Joined", "Active", "Retention %"])
+    st.dataframe(cohorts, use_container_width=True)
+
+    st.caption("Statistics are refreshed every few minutes")
+
+
+main()
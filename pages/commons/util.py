@@ -1,9 +1,16 @@
+import uuid
+
 import streamlit as st
+from peewee import Field, ModelSelect
 
-from src.model.User import User
+from src.model.enums.PageDirection import PageDirection
+from src.model.pagination.KeysetPage import KeysetPage
+from src.model.projection.UserListRow import UserListRow
+from src.service.pagination_service import get_page
+from src.service.user_search_service import search_users
 
 
-def select_user_select_box(key_suffix: str) -> tuple[str, list[tuple[str, User]]]:
+def select_user_select_box(key_suffix: str) -> tuple[str, list[tuple[str, UserListRow]]]:
     """
     Select user select box
     :param key_suffix: The key suffix for the select box
@@ -13,12 +20,12 @@ def select_user_select_box(key_suffix: str) -> tuple[str, list[tuple[str, User]]
     # Filter input box
     filter_user_by = st.text_input(label="Search users", key=f"filter_user_by{key_suffix}")
 
-    users: list[User] = []
+    users: list[UserListRow] = []
     if len(filter_user_by) > 1:
-        users: list[User] = User.get_by_string_filter(filter_user_by)
+        users: list[UserListRow] = search_users(filter_user_by, get_search_key(key_suffix))
 
     # Map users to display name
-    users_display_name_map: list[tuple[str, User]] = [(
+    users_display_name_map: list[tuple[str, UserListRow]] = [(
         user.get_display_name(add_user_id=True), user) for user in users]
 
     # Select box with users
@@ -29,9 +36,24 @@ def select_user_select_box(key_suffix: str) -> tuple[str, list[tuple[str, User]]
     return selected_user_display_name, users_display_name_map
 
 
-def get_selected_user(display_name: str, users_display_name_map: list[tuple[str, User]]) -> User:
+def get_search_key(key_suffix: str) -> str:
+    """
+    Gets the key of a user search box, unique by session, so that a search superseded by a newer one of the same box
+    is dropped
+    :param key_suffix: The key suffix of the search box
+    :return: The search key
+    """
+
+    if "search_session_id" not in st.session_state:
+        st.session_state["search_session_id"] = uuid.uuid4().hex
+
+    return st.session_state["search_session_id"] + key_suffix
+
+
+def get_selected_user(display_name: str, users_display_name_map: list[tuple[str, UserListRow]]
+                      ) -> UserListRow | None:
     """
-    Gets the selected user
+    Gets the selected user, use User.get_by_id to load the full user
     :param display_name: Display name
     :param users_display_name_map: Users display name map
     :return: Selected user
@@ -41,3 +63,54 @@ def get_selected_user(display_name: str, users_display_name_map: list[tuple[str,
     for user_display_name, user in users_display_name_map:
         if user_display_name == display_name:
             return user
+
+
+def get_paginated(query: ModelSelect, sort_field: Field, key_suffix: str, ascending: bool = False) -> KeysetPage:
+    """
+    Gets the current page of the query, as selected with the page navigation
+    :param query: The query
+    :param sort_field: The sort field
+    :param key_suffix: The key suffix of the page navigation
+    :param ascending: If the items should be sorted in ascending order
+    :return: The current page
+    """
+
+    return get_page(query, sort_field, st.session_state.get(f"page_cursor{key_suffix}"), ascending=ascending)
+
+
+def show_page_navigation(page: KeysetPage, key_suffix: str) -> None:
+    """
+    Show the first, previous and next page buttons
+    :param page: The current page
+    :param key_suffix: The key suffix of the page navigation
+    :return: None
+    """
+
+    col_first, col_previous, col_next = st.columns(3)
+    col_first.button("First", key=f"page_first{key_suffix}", on_click=set_page_cursor, args=[key_suffix, None],
+                     disabled=(st.session_state.get(f"page_cursor{key_suffix}") is None))
+    col_previous.button("Previous", key=f"page_previous{key_suffix}", on_click=set_page_cursor,
+                        args=[key_suffix, page.previous_cursor], disabled=(page.previous_cursor is None))
+    col_next.button("Next", key=f"page_next{key_suffix}", on_click=set_page_cursor,
+                    args=[key_suffix, page.next_cursor], disabled=(page.next_cursor is None))
+
+
+def set_page_cursor(key_suffix: str, cursor: tuple[PageDirection, any, int] | None) -> None:
+    """
+    Set the cursor of the page navigation
+    :param key_suffix: The key suffix of the page navigation
+    :param cursor: The cursor, None to go back to the first page
+    :return: None
+    """
+
+    st.session_state[f"page_cursor{key_suffix}"] = cursor
+
+
+def reset_page_cursor(key_suffix: str) -> None:
+    """
+    Go back to the first page, used when the filters of the list change
+    :param key_suffix: The key suffix of the page navigation
+    :return: None
+    """
+
+    set_page_cursor(key_suffix, None)
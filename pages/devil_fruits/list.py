@@ -1,11 +1,11 @@
 import streamlit as st
 
-import resources.Environment as Env
-from pages.commons.util import select_user_select_box, get_selected_user
+from pages.commons.util import select_user_select_box, get_selected_user, get_paginated, show_page_navigation, \
+    reset_page_cursor
 from pages.devil_fruits.commons import show_and_get_abilities_multi_select, show_add_form, save
 from src.model.DevilFruit import DevilFruit
 from src.model.DevilFruitAbility import DevilFruitAbility
-from src.model.User import User
+from src.model.projection.UserListRow import UserListRow
 from src.model.enums.devil_fruit.DevilFruitAbilityType import DevilFruitAbilityType
 from src.model.enums.devil_fruit.DevilFruitStatus import DevilFruitStatus
 from src.model.tgrest.TgRestDevilFruitAward import TgRestDevilFruitAward
@@ -23,23 +23,24 @@ def main() -> None:
     # Filter by status multiselect
     default_status = [DevilFruitStatus.NEW, DevilFruitStatus.COMPLETED, DevilFruitStatus.ENABLED]
     status_filter: list[str] = st.multiselect("Status filter", DevilFruitStatus.get_all_description(),
-                                              [status.get_description() for status in default_status])
+                                              [status.get_description() for status in default_status],
+                                              on_change=reset_page_cursor, args=[key_suffix])
 
     selected_statuses = [DevilFruitStatus.get_by_description(status_str) for status_str in status_filter]
 
     # Filter by name text input
-    name_filter = st.text_input("Name filter", "")
+    name_filter = st.text_input("Name filter", "", on_change=reset_page_cursor, args=[key_suffix])
 
     # Get fruits
-    devil_fruits: list[DevilFruit] = (DevilFruit.select()
-                                      .where((DevilFruit.status.in_(selected_statuses))
-                                             & ((DevilFruit.name.contains(name_filter))
-                                                | (DevilFruit.model.contains(name_filter))))
-                                      .order_by(DevilFruit.id.desc())
-                                      .limit(Env.MAX_ITEMS_DISPLAYED_LIST.get_int()))
-
-    for index, devil_fruit in enumerate(devil_fruits):
-        key_suffix_list = f"{key_suffix}_{index}"
+    query = (DevilFruit.select()
+             .where((DevilFruit.status.in_(selected_statuses))
+                    & ((DevilFruit.name.contains(name_filter))
+                       | (DevilFruit.model.contains(name_filter)))))
+    page = get_paginated(query, DevilFruit.id, key_suffix)
+    devil_fruits: list[DevilFruit] = page.items
+
+    for devil_fruit in devil_fruits:
+        key_suffix_list = f"{key_suffix}_{devil_fruit.id}"
         status: DevilFruitStatus = DevilFruitStatus(devil_fruit.status)
 
         with st.expander(devil_fruit.get_full_name()):
@@ -70,7 +71,7 @@ def main() -> None:
                     reason: str = st.text_input(label="Reason", key=f"reason{key_suffix_list}")
                     # Award button
                     if st.button("Award", key=f"award{key_suffix_list}", disabled=(selected_user_display_name is None)):
-                        selected_user: User = get_selected_user(selected_user_display_name, users_display_name_map)
+                        selected_user: UserListRow = get_selected_user(selected_user_display_name, users_display_name_map)
                         # Reason is required
                         if len(reason) == 0:
                             st.error("Reason is required")
@@ -89,3 +90,5 @@ def main() -> None:
                     else:
                         devil_fruit.delete_instance()
                         st.success("Devil fruit deleted, refresh the page")
+
+    show_page_navigation(page, key_suffix)
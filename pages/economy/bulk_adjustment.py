@@ -0,0 +1,99 @@
+import altair as alt
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from pages.users.filter import show_and_get_user_filter
+from src.model.User import User
+from src.model.exceptions.BulkAdjustmentException import BulkAdjustmentException
+from src.model.exceptions.ValidationException import ValidationException
+from src.service.bounty_adjustment_service import parse_tg_user_ids, get_users_by_tg_user_ids, get_target_bounties, \
+    get_adjusted_bounties, apply_bounty_adjustment, decode_csv
+from src.service.economy_service import get_histogram
+
+TARGET_FILTER = "Filter"
+TARGET_CSV = "CSV of user ids"
+
+
+def main() -> None:
+    """
+    Bulk bounty adjustment function
+    :return:
+    """
+
+    key_suffix = "_bulk_adjustment"
+    preview_key = f"preview{key_suffix}"
+
+    # Targets
+    target = st.radio("Targets", [TARGET_FILTER, TARGET_CSV], horizontal=True, key=f"target{key_suffix}")
+    query = None
+    if target == TARGET_FILTER:
+        query = show_and_get_user_filter(key_suffix).apply(User.select())
+    else:
+        csv_file = st.file_uploader("CSV with the Telegram user ids in the first column", type="csv",
+                                    key=f"csv{key_suffix}")
+        if csv_file is not None:
+            try:
+                tg_user_ids = parse_tg_user_ids(decode_csv(csv_file.getvalue()))
+                query = get_users_by_tg_user_ids(tg_user_ids)
+            except ValidationException as ve:
+                st.error(ve.message)
+
+    amount = st.number_input("Amount", value=0, step=1000000, key=f"amount{key_suffix}",
+                             help="Negative for a penalty, which never brings a bounty below zero")
+
+    if st.button("Preview", key=f"preview_button{key_suffix}", disabled=(query is None or amount == 0)):
+        user_ids, bounties = get_target_bounties(query)
+        st.session_state[preview_key] = (user_ids, bounties, amount)
+
+    if preview_key not in st.session_state:
+        return
+
+    user_ids, bounties, preview_amount = st.session_state[preview_key]
+    if preview_amount != amount:
+        st.warning("The amount changed, preview again")
+        return
+
+    show_preview(bounties, amount)
+
+    confirmed = st.checkbox(f"I confirm the adjustment of {len(user_ids):,} users", key=f"confirm{key_suffix}")
+    if st.button("Apply", key=f"apply{key_suffix}", disabled=(not confirmed or len(user_ids) == 0)):
+        # Cleared before applying, so that a partially applied adjustment can not be applied again
+        del st.session_state[preview_key]
+        try:
+            updated_count = apply_bounty_adjustment(user_ids, amount)
+            st.success(f"Bounty adjusted for {updated_count:,} users")
+        except BulkAdjustmentException as e:
+            st.error(e.message)
+            if e.updated_count > 0:
+                st.warning("The adjusted users are already committed, preview again only the remaining ones")
+
+
+def show_preview(bounties: np.ndarray, amount: int) -> None:
+    """
+    Show the impact of the adjustment and the distribution of the bounties before and after it
+    :param bounties: The current bounties of the targets
+    :param amount: The amount to add
+    :return: None
+    """
+
+    adjusted_bounties = get_adjusted_bounties(bounties, amount)
+    changes = adjusted_bounties - bounties
+
+    col_users, col_changed, col_impact = st.columns(3)
+    col_users.metric("Users", "{0:,}".format(len(bounties)))
+    col_changed.metric("Bounties changed", "{0:,}".format(int(np.count_nonzero(changes))))
+    col_impact.metric("Total impact", "{0:+,}".format(int(changes.sum())))
+
+    if len(bounties) == 0:
+        return
+
+    # Same buckets for both histograms
+    sorted_bounties, sorted_adjusted_bounties = np.sort(bounties), np.sort(adjusted_bounties)
+    max_amount = int(max(sorted_bounties[-1], sorted_adjusted_bounties[-1]))
+    for col, description, sorted_values in zip(st.columns(2), ["Before", "After"],
+                                               [sorted_bounties, sorted_adjusted_bounties]):
+        histogram = get_histogram(sorted_values, max_amount)
+        col.caption(description)
+        col.altair_chart(alt.Chart(pd.DataFrame({"Range": list(histogram.keys()), "Users": list(histogram.values())}))
+                         .mark_bar().encode(x=alt.X("Range", sort=None), y="Users"), use_container_width=True)
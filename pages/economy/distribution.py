@@ -0,0 +1,41 @@
+import altair as alt
+import pandas as pd
+import streamlit as st
+
+from src.service.economy_service import get_bounty_distributions
+
+COLUMN_DESCRIPTIONS = {"bounty": "Bounty", "pending_bounty": "Pending bounty",
+                       "total_gained_bounty": "Total gained bounty"}
+
+
+def main() -> None:
+    """
+    Bounty distribution function
+    :return:
+    """
+
+    key_suffix = "_distribution"
+
+    column_description = st.selectbox("Column", list(COLUMN_DESCRIPTIONS.values()), key=f"column{key_suffix}")
+    column = next(name for name, description in COLUMN_DESCRIPTIONS.items() if description == column_description)
+
+    distribution: dict = get_bounty_distributions()[column]
+
+    col_1, col_2, col_3, col_4 = st.columns(4)
+    col_1.metric("Users", "{0:,}".format(distribution["count"]))
+    col_2.metric("Total", "{0:,}".format(distribution["total"]))
+    col_3.metric("Gini coefficient", f"{distribution['gini']:.3f}")
+    col_4.metric("Held by top 1%", f"{distribution['top_1_percent_share'] * 100:.1f}%")
+
+    # Quantiles
+    st.dataframe([{"Mean": "{0:,.0f}".format(distribution["mean"])}
+                  | {f"P{int(q * 100)}": "{0:,}".format(v) for q, v in distribution["quantiles"].items()}],
+                 use_container_width=True)
+
+    # Histogram, keeping the buckets in order of magnitude
+    histogram = pd.DataFrame({"Range": list(distribution["histogram"].keys()),
+                              "Users": list(distribution["histogram"].values())})
+    st.altair_chart(alt.Chart(histogram).mark_bar().encode(x=alt.X("Range", sort=None), y="Users"),
+                    use_container_width=True)
+
+    st.caption("Statistics are refreshed every few minutes")
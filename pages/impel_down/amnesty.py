@@ -0,0 +1,56 @@
+import streamlit as st
+
+from src.model.User import User
+from src.model.enums.impel_down.ImpelDownBountyAction import ImpelDownBountyAction
+from src.model.enums.impel_down.ImpelDownSentenceType import ImpelDownSentenceType
+from src.service.impel_down_service import get_amnesty_candidates, get_sources, sentence_users, \
+    notify_sentenced_users
+
+ANY_SOURCE = "Any"
+
+
+def main() -> None:
+    """
+    Amnesty function
+    :return:
+    """
+
+    key_suffix = "_amnesty"
+
+    # Filters
+    only_temporary = st.checkbox("Temporary sentences only", value=True, key=f"only_temporary{key_suffix}")
+
+    sentenced_before = None
+    if st.checkbox("Sentenced before a date", key=f"filter_sentenced_before{key_suffix}"):
+        sentenced_before = st.date_input("Sentenced before", key=f"sentenced_before{key_suffix}")
+
+    source = st.selectbox("Source", [ANY_SOURCE] + get_sources(), key=f"source{key_suffix}")
+
+    query = get_amnesty_candidates(only_temporary, sentenced_before, source if source != ANY_SOURCE else None)
+    candidates_count = query.count()
+    st.metric("Users to release", "{0:,}".format(candidates_count))
+
+    reason = st.text_input("Reason", key=f"reason{key_suffix}")
+    confirmed = st.checkbox(f"I confirm the release of {candidates_count:,} users", key=f"confirm{key_suffix}")
+
+    if not st.button("Release", key=f"release{key_suffix}",
+                     disabled=(not confirmed or candidates_count == 0 or len(reason) == 0)):
+        return
+
+    user_ids = [user_id for (user_id,) in query.select(User.id).tuples()]
+    try:
+        log_ids: dict[int, int] = sentence_users(user_ids, ImpelDownSentenceType.NONE, None,
+                                                 ImpelDownBountyAction.NONE, reason)
+    except Exception as e:
+        st.error(f"Error releasing the users: {e}")
+        return
+
+    st.success(f"{len(log_ids)} users released")
+
+    progress_bar = st.progress(0, text="Sending notifications")
+    failed_user_ids = notify_sentenced_users(
+        log_ids, ImpelDownSentenceType.NONE, None, ImpelDownBountyAction.NONE, reason,
+        on_progress=lambda sent, total: progress_bar.progress(sent / total, text=f"Notified {sent}/{total} users"))
+
+    if len(failed_user_ids) > 0:
+        st.error(f"Notification not sent to {len(failed_user_ids)} users")
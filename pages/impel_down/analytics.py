@@ -0,0 +1,54 @@
+import datetime
+
+import altair as alt
+import pandas as pd
+import streamlit as st
+
+from src.service.impel_down_analytics_service import get_daily_statistics, get_reversal_and_bail_statistics, \
+    get_top_bail_payers
+
+PERIODS_DAYS = {"Last 7 days": 7, "Last 30 days": 30, "Last 90 days": 90, "Last year": 365}
+TOP_BAIL_PAYERS_COUNT = 10
+
+
+def main() -> None:
+    """
+    Analytics function
+    :return:
+    """
+
+    key_suffix = "_impel_down_analytics"
+
+    period = st.radio("Period", list(PERIODS_DAYS.keys()), horizontal=True, key=f"period{key_suffix}")
+    start_day = datetime.date.today() - datetime.timedelta(days=PERIODS_DAYS[period] - 1)
+
+    daily_statistics = pd.DataFrame(get_daily_statistics(), columns=["day", "source", "sentences", "erased", "halved"])
+    daily_statistics = daily_statistics[daily_statistics["day"] >= start_day]
+
+    col_sentences, col_erased, col_halved = st.columns(3)
+    col_sentences.metric("Sentences", "{0:,}".format(int(daily_statistics["sentences"].sum())))
+    col_erased.metric("Bounty erased", "{0:,}".format(int(daily_statistics["erased"].sum())))
+    col_halved.metric("Bounty lost to halving", "{0:,}".format(int(daily_statistics["halved"].sum())))
+
+    # Sentences per day by source
+    st.subheader("Sentences per day")
+    st.altair_chart(alt.Chart(daily_statistics).mark_bar().encode(
+        x=alt.X("day:T", title="Day"), y=alt.Y("sentences:Q", title="Sentences"),
+        color=alt.Color("source:N", title="Source"), tooltip=["day", "source", "sentences"]), use_container_width=True)
+
+    # Reversals and bails, over the whole history
+    st.subheader("Reversals and bails")
+    reversal_and_bail_statistics = get_reversal_and_bail_statistics()
+    bounty_actions = reversal_and_bail_statistics["bounty_actions"]
+    reversal_rate = reversal_and_bail_statistics["reversed"] / bounty_actions if bounty_actions > 0 else 0
+
+    col_reversal_rate, col_bails, col_bail_volume = st.columns(3)
+    col_reversal_rate.metric("Reversal rate", f"{reversal_rate * 100:.1f}%")
+    col_bails.metric("Bails", "{0:,}".format(reversal_and_bail_statistics["bails"]))
+    col_bail_volume.metric("Bail volume", "{0:,}".format(reversal_and_bail_statistics["bail_volume"]))
+
+    st.subheader("Top bail payers")
+    st.dataframe(pd.DataFrame(get_top_bail_payers(TOP_BAIL_PAYERS_COUNT), columns=["user", "bails", "amount"])
+                 .rename(columns={"user": "User", "bails": "Bails", "amount": "Amount"}), use_container_width=True)
+
+    st.caption("Reversal and bail statistics are refreshed every few minutes")
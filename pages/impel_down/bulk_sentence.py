@@ -0,0 +1,92 @@
+from datetime import datetime
+
+import streamlit as st
+
+from pages.users.impel_down import validate
+from src.model.User import User
+from src.model.enums.impel_down.ImpelDownBountyAction import ImpelDownBountyAction
+from src.model.enums.impel_down.ImpelDownSentenceType import ImpelDownSentenceType
+from src.model.exceptions.ValidationException import ValidationException
+from src.service.bounty_adjustment_service import parse_tg_user_ids, get_users_by_tg_user_ids
+from src.service.impel_down_service import sentence_users, notify_sentenced_users
+
+
+def main() -> None:
+    """
+    Bulk sentence function
+    :return:
+    """
+
+    key_suffix = "_bulk_sentence"
+
+    with st.form(f"bulk_sentence_form{key_suffix}"):
+        tg_user_ids_text = st.text_area("Telegram user ids", key=f"tg_user_ids{key_suffix}",
+                                        help="One per line, or a CSV with the user ids in the first column")
+
+        sentence_type = st.radio("Sentence", [e for e in ImpelDownSentenceType], index=1,
+                                 key=f"sentence_radio{key_suffix}")
+
+        # Release date and time
+        col_release_date, col_release_time = st.columns(2)
+        release_date = col_release_date.date_input("Release date", key=f"release_date{key_suffix}")
+        release_time = col_release_time.time_input("Release time", key=f"release_time{key_suffix}")
+
+        bounty_action = st.radio("Bounty action", [e for e in ImpelDownBountyAction], index=0,
+                                 key=f"bounty_action{key_suffix}")
+
+        reason = st.text_input("Reason", key=f"reason{key_suffix}")
+
+        submitted = st.form_submit_button("Sentence")
+
+        if submitted:
+            save(tg_user_ids_text, ImpelDownSentenceType(sentence_type), ImpelDownBountyAction(bounty_action),
+                 release_date, release_time, reason)
+
+
+def save(tg_user_ids_text: str, sentence_type: ImpelDownSentenceType, bounty_action: ImpelDownBountyAction,
+         release_date: datetime, release_time: datetime.time, reason: str) -> None:
+    """
+    Sentence the users and notify them
+    :param tg_user_ids_text: The Telegram user ids, one per line
+    :param sentence_type: Sentence type
+    :param bounty_action: Bounty action
+    :param release_date: Release date
+    :param release_time: Release time
+    :param reason: Reason
+    :return: None
+    """
+
+    try:
+        # Message is always sent
+        validate(sentence_type, release_date, release_time, True, reason)
+
+        tg_user_ids = parse_tg_user_ids(tg_user_ids_text)
+        if len(tg_user_ids) == 0:
+            raise ValidationException("At least one user id is required")
+    except ValidationException as ve:
+        st.error(ve)
+        return
+
+    users: dict[int, str] = {user_id: tg_user_id for user_id, tg_user_id in (
+        get_users_by_tg_user_ids(tg_user_ids).select(User.id, User.tg_user_id).tuples())}
+    missing_tg_user_ids = set(tg_user_ids) - set(users.values())
+    if len(missing_tg_user_ids) > 0:
+        st.warning(f"Users not found: {', '.join(sorted(missing_tg_user_ids))}")
+
+    release_date_time = datetime.combine(release_date, release_time)
+    try:
+        log_ids: dict[int, int] = sentence_users(list(users.keys()), sentence_type, release_date_time, bounty_action,
+                                                 reason)
+    except Exception as e:
+        st.error(f"Error sentencing the users: {e}")
+        return
+
+    st.success(f"{len(log_ids)} users sentenced")
+
+    progress_bar = st.progress(0, text="Sending notifications")
+    failed_user_ids = notify_sentenced_users(
+        log_ids, sentence_type, release_date_time, bounty_action, reason,
+        on_progress=lambda sent, total: progress_bar.progress(sent / total, text=f"Notified {sent}/{total} users"))
+
+    if len(failed_user_ids) > 0:
+        st.error(f"Notification not sent to: {', '.join(users[user_id] for user_id in failed_user_ids)}")
@@ -0,0 +1,47 @@
+import streamlit as st
+
+from pages.commons.util import get_paginated, show_page_navigation, reset_page_cursor
+from src.model.User import User
+from src.service.date_service import get_remaining_times_in_seconds, format_durations
+from src.service.impel_down_service import get_temporarily_imprisoned_users, get_permanently_imprisoned_users
+
+TEMPORARY = "Temporary sentence"
+PERMANENT = "Permanent sentence"
+
+
+def main() -> None:
+    """
+    View imprisoned users function
+    :return:
+    """
+
+    key_suffix = "_imprisoned"
+
+    temporary_query = get_temporarily_imprisoned_users()
+    permanent_query = get_permanently_imprisoned_users()
+
+    col_temporary, col_permanent = st.columns(2)
+    col_temporary.metric(TEMPORARY, "{0:,}".format(temporary_query.count()))
+    col_permanent.metric(PERMANENT, "{0:,}".format(permanent_query.count()))
+
+    sentence = st.radio("Sentence", [TEMPORARY, PERMANENT], horizontal=True, key=f"sentence{key_suffix}",
+                        on_change=reset_page_cursor, args=[key_suffix])
+
+    if sentence == TEMPORARY:
+        # Upcoming releases first
+        page = get_paginated(temporary_query, User.impel_down_release_date, key_suffix, ascending=True)
+        users: list[User] = page.items
+
+        release_dates = [user.impel_down_release_date for user in users]
+        remaining_times = format_durations(get_remaining_times_in_seconds(release_dates))
+        st.dataframe([{"User": user.get_display_name(add_user_id=True), "Release": release_date,
+                       "Remaining": remaining_time}
+                      for user, release_date, remaining_time in zip(users, release_dates, remaining_times)],
+                     use_container_width=True)
+    else:
+        page = get_paginated(permanent_query, User.id, key_suffix)
+        users: list[User] = page.items
+
+        st.dataframe([{"User": user.get_display_name(add_user_id=True)} for user in users], use_container_width=True)
+
+    show_page_navigation(page, key_suffix)
@@ -0,0 +1,148 @@
+import datetime
+
+import streamlit as st
+
+import resources.Environment as Env
+from pages.commons.util import get_paginated, show_page_navigation, reset_page_cursor
+from src.model.ImpelDownLog import ImpelDownLog
+from src.model.ImpelDownLogArchive import ImpelDownLogArchive
+from src.model.exceptions.ValidationException import ValidationException
+from src.service.impel_down_service import get_logs_by_string_filter, get_log_display_text, reverse_bounty_action, \
+    get_logs, filter_logs_by_date, reverse_bounty_actions, archive_logs
+
+
+def main() -> None:
+    """
+    View records function
+    :return:
+    """
+
+    key_suffix = "_impel_down_logs"
+
+    # Recent logs by default, archived ones only on request
+    period = st.radio("Logs", ["Recent", "Archive"], horizontal=True, key=f"period{key_suffix}",
+                      on_change=reset_page_cursor, args=[key_suffix],
+                      help=f"Logs older than {Env.IMPEL_DOWN_LOG_ARCHIVE_AGE_DAYS.get_int()} days are archived")
+    is_archive = period == "Archive"
+    log_model: type[ImpelDownLog | ImpelDownLogArchive] = ImpelDownLogArchive if is_archive else ImpelDownLog
+
+    # Filter records by first name, last name, username or user id, sentence reason
+    filter_by = st.text_input(
+        label="Search", key=f"filter_by{key_suffix}", on_change=reset_page_cursor, args=[key_suffix],
+        help="Search by first name, last name, username, user id, bounty action, sentence reason or type")
+
+    # Filter by date range
+    date_range = None
+    if st.checkbox("Filter by date", key=f"filter_date{key_suffix}", on_change=reset_page_cursor, args=[key_suffix]):
+        today = datetime.date.today()
+        dates = st.date_input("Date", value=(today - datetime.timedelta(days=7), today), key=f"date_range{key_suffix}",
+                              on_change=reset_page_cursor, args=[key_suffix])
+        # While picking the range only the first date is set
+        if len(dates) == 2:
+            date_range = dates
+
+    # Filter logs
+    if len(filter_by) > 1:
+        query = get_logs_by_string_filter(filter_by, log_model)
+    else:
+        query = get_logs(log_model)
+
+    # Filtered by date, logs are read and sorted on the date index
+    if date_range is not None:
+        query = filter_logs_by_date(query, *date_range)
+        page = get_paginated(query, log_model.date_time, key_suffix)
+    else:
+        page = get_paginated(query, log_model.id, key_suffix)
+    logs: list[ImpelDownLog | ImpelDownLogArchive] = page.items
+    selected_log_ids: list[int] = []
+
+    for log in logs:
+        expander_text = get_log_display_text(log)
+
+        with st.expander(expander_text):
+            # Basic information
+            col0 = st.columns(1)[0]
+            col_1, col_2 = st.columns(2)
+
+            # Reason (if applicable)
+            if log.reason is not None:
+                col0.info(log.reason)
+
+            # Date (if applicable)
+            if log.date_time is not None:
+                col_1.text_input("Date", value=log.date_time, disabled=True,
+                                 key=f"date{key_suffix}{log.id}")
+
+            # Sentence type and release datetime (if applicable)
+            if log.sentence_type is not None:
+                col_1.text_input("Sentence Type", value=log.sentence_type, disabled=True,
+                                 key=f"sentence_type{key_suffix}{log.id}")
+                release_datetime_string = log.release_date_time if log.release_date_time is not None else "Undefined"
+                col_2.text_input("Release Datetime", value=release_datetime_string, disabled=True,
+                                 key=f"release_datetime{key_suffix}{log.id}")
+
+            # Bail (if applicable)
+            if log.bail_amount is not None:
+                col_1.text_input("Bail", value='{0:,}'.format(log.bail_amount), disabled=True,
+                                 key=f"bail_amount{key_suffix}{log.id}")
+                bail_payer_string = log.bail_payer.get_display_name() if log.bail_payer is not None else "Undefined"
+                col_2.text_input("Bail Payer", value=bail_payer_string, disabled=True,
+                                 key=f"bail_payer{key_suffix}{log.id}")
+                if log.bail_date is not None:
+                    col_1.text_input("Bail Date", value=log.bail_date, disabled=True,
+                                     key=f"bail_date{key_suffix}{log.id}")
+
+            # Bounty action and lost bounty (if applicable)
+            if log.bounty_action is not None:
+                col_1.text_input("Bounty Action", value=log.bounty_action, disabled=True,
+                                 key=f"bounty_action{key_suffix}{log.id}")
+                lost_bounty_string = '{0:,}'.format(log.previous_bounty - log.new_bounty)
+                col_2.text_input("Lost Bounty", value=lost_bounty_string, disabled=True,
+                                 key=f"lost_bounty{key_suffix}{log.id}")
+
+                # Reverse bounty action and lost bounty, archived logs are read only
+                reverse_button_is_enabled = not log.is_reversed and not is_archive
+
+                if col_1.button("Reverse", key=f"reverse_button{key_suffix}{log.id}",
+                                disabled=not reverse_button_is_enabled):
+                    try:
+                        reverse_bounty_action(log)
+
+                        st.success("Bounty action reversed successfully")
+                    except ValidationException as e:
+                        st.error(e.message)
+
+                # Select for bulk reversal
+                if col_2.checkbox("Select", key=f"select{key_suffix}{log.id}", disabled=not reverse_button_is_enabled):
+                    selected_log_ids.append(log.id)
+
+    show_page_navigation(page, key_suffix)
+
+    if is_archive:
+        # Archival job
+        st.subheader("Archive old logs")
+        if st.button("Archive now", key=f"archive{key_suffix}"):
+            progress_text = st.empty()
+            archived_count = archive_logs(
+                on_progress=lambda count: progress_text.text(f"{count:,} logs archived, archiving..."))
+            progress_text.empty()
+            st.success(f"{archived_count:,} logs archived")
+
+        return
+
+    # Bulk reversal
+    st.subheader("Bulk reverse")
+    col_selected, col_all = st.columns(2)
+    if col_selected.button(f"Reverse {len(selected_log_ids)} selected", key=f"reverse_selected{key_suffix}",
+                           disabled=len(selected_log_ids) == 0):
+        reversed_count = reverse_bounty_actions(selected_log_ids)
+        st.success(f"{reversed_count} bounty actions reversed, refresh the page")
+
+    # All the logs matching the filters, e.g. a mistaken mass sentence
+    confirm_all = col_all.checkbox("Confirm reversal of all the logs matching the filters",
+                                   key=f"confirm_reverse_all{key_suffix}",
+                                   disabled=(len(filter_by) <= 1 and date_range is None))
+    if col_all.button("Reverse all matching", key=f"reverse_all{key_suffix}", disabled=not confirm_all):
+        log_ids = [log_id for (log_id,) in query.select(ImpelDownLog.id).order_by().tuples()]
+        reversed_count = reverse_bounty_actions(log_ids)
+        st.success(f"{reversed_count} bounty actions reversed, refresh the page")
@@ -9,6 +9,7 @@ from src.model.enums.PredictionStatus import PredictionStatus
 from src.model.enums.PredictionType import PredictionType
 from src.model.exceptions.ValidationException import ValidationException
 from src.service.form_service import get_session_state_key
+from src.service.prediction_service import save_prediction
 
 
 def get_add_form_optionals(key_suffix: str, prediction: Prediction = None, prediction_options: list = None
@@ -152,58 +153,89 @@ def validate(key_suffix: str, prediction: Prediction) -> None:
     :return:
     """
 
+    options = [get_session_state_key(f"option_{i}", key_suffix)
+               for i in range(get_session_state_key("options_count", key_suffix))]
+
+    send_datetime = datetime.combine(get_session_state_key("send_date", key_suffix),
+                                     get_session_state_key("send_time", key_suffix)) \
+        if get_session_state_key("should_send", key_suffix) else None
+
+    end_datetime = datetime.combine(get_session_state_key("end_date", key_suffix),
+                                    get_session_state_key("end_time", key_suffix)) \
+        if get_session_state_key("should_end", key_suffix) else None
+
+    cut_off_datetime = datetime.combine(get_session_state_key("cut_off_date", key_suffix),
+                                        get_session_state_key("cut_off_time", key_suffix)) \
+        if get_session_state_key("should_cut_off", key_suffix) else None
+
+    validate_values(prediction, get_session_state_key("question", key_suffix), options, send_datetime, end_datetime,
+                    cut_off_datetime, get_session_state_key("multiple_choices", key_suffix),
+                    get_session_state_key("refund_wager", key_suffix))
+
+
+def validate_values(prediction: Prediction | None, question: str, options: list[str], send_datetime: datetime | None,
+                    end_datetime: datetime | None, cut_off_datetime: datetime | None, multiple_choices: bool,
+                    refund_wager: bool, check_duplicate: bool = True) -> None:
+    """
+    Validates the values of a prediction, from the form or from an import. Raises an exception if not valid
+    :param prediction: The stored prediction, None for a new one
+    :param question: The question
+    :param options: The option texts
+    :param send_datetime: The scheduled send date, None if not scheduled
+    :param end_datetime: The scheduled end date, None if not scheduled
+    :param cut_off_datetime: The bets cut off date, None if not set
+    :param multiple_choices: If multiple choices are allowed
+    :param refund_wager: If wagers are refunded
+    :param check_duplicate: If the question should be looked up, False if the caller already checked it
+    :return: None
+    """
+
     prediction_status: PredictionStatus = PredictionStatus(prediction.status) if prediction is not None else None
     is_sent = prediction is not None and prediction_status >= PredictionStatus.SENT
     is_closed = prediction is not None and prediction_status >= PredictionStatus.BETS_CLOSED
 
-    if get_session_state_key("question", key_suffix) == "":
+    if question is None or question.strip() == "":
         raise ValidationException("Question is required")
 
-    for i in range(get_session_state_key("options_count", key_suffix)):
-        if get_session_state_key(f"option_{i}{key_suffix}", key_suffix) == "":
-            raise ValidationException(f"Option {i + 1} is required")
+    # Same question, ignoring case and surrounding spaces
+    if check_duplicate:
+        existing_prediction: Prediction = Prediction.get_by_question(question)
+        if existing_prediction is not None and (prediction is None or existing_prediction.id != prediction.id):
+            raise ValidationException("A prediction with the same question already exists")
 
-    should_send = get_session_state_key("should_send", key_suffix)
-    should_send_datetime = None  # To silence IDE warning
+    for i, option in enumerate(options):
+        if option is None or str(option).strip() == "":
+            raise ValidationException(f"Option {i + 1} is required")
 
     # If not already sent, validate send date and time
-    if should_send:
-        should_send_datetime = datetime.combine(get_session_state_key("send_date", key_suffix),
-                                                get_session_state_key("send_time", key_suffix))
-
-        if not is_sent:
-            if get_session_state_key("send_date", key_suffix) < datetime.now().date():
-                raise ValidationException("Send date cannot be earlier than today")
+    if send_datetime is not None and not is_sent:
+        if send_datetime.date() < datetime.now().date():
+            raise ValidationException("Send date cannot be earlier than today")
 
-            if should_send_datetime < datetime.now():
-                raise ValidationException("Send time cannot be earlier than now")
+        if send_datetime < datetime.now():
+            raise ValidationException("Send time cannot be earlier than now")
 
     # If not already closed, validate end date and time
-    if get_session_state_key("should_end", key_suffix) and not is_closed:
-        if get_session_state_key("end_date", key_suffix) < datetime.now().date():
+    if end_datetime is not None and not is_closed:
+        if end_datetime.date() < datetime.now().date():
             raise ValidationException("End date cannot be earlier than today")
 
-        should_end_datetime = datetime.combine(get_session_state_key("end_date", key_suffix),
-                                               get_session_state_key("end_time", key_suffix))
-        if should_end_datetime < datetime.now():
+        if end_datetime < datetime.now():
             raise ValidationException("End time cannot be earlier than now")
 
-        if should_send and should_end_datetime <= should_send_datetime:
+        if send_datetime is not None and end_datetime <= send_datetime:
             raise ValidationException("End time must be later than send time")
 
     # If not already closed, validate cut off date and time
-    if get_session_state_key("should_cut_off", key_suffix) and not is_closed:
-        should_cut_off_datetime = datetime.combine(get_session_state_key("cut_off_date", key_suffix),
-                                                   get_session_state_key("cut_off_time", key_suffix))
-
-        if should_cut_off_datetime > datetime.now():
+    if cut_off_datetime is not None and not is_closed:
+        if cut_off_datetime > datetime.now():
             raise ValidationException("Cut off time cannot be later than now")
 
-        if should_cut_off_datetime <= should_send_datetime:
+        if send_datetime is not None and cut_off_datetime <= send_datetime:
             raise ValidationException("Cut off time must be later than send time")
 
     # Check that multiple choices are not allowed if wagers are refunded
-    if get_session_state_key("multiple_choices", key_suffix) and get_session_state_key("refund_wager", key_suffix):
+    if multiple_choices and refund_wager:
         raise ValidationException("Multiple choices are not allowed if wagers are refunded")
 
 
@@ -252,27 +284,9 @@ def save(options_count: int, key_suffix: str, prediction: Prediction = None, pre
             prediction.allow_multiple_choices = get_session_state_key("multiple_choices", key_suffix)
             prediction.can_withdraw_bet = get_session_state_key("can_withdraw_bet", key_suffix)
 
-            prediction.save()
-
-            # Save options
-            should_save_options = True
+            # Save with the options
             options_form = [get_session_state_key("option", f"_{i}{key_suffix}") for i in range(options_count)]
-            # In case of already existing prediction, delete all options if they are different
-            if not is_new:
-                options_saved = [option.option for option in prediction_options]
-                if options_form != options_saved:
-                    PredictionOption.delete().where(PredictionOption.prediction == prediction).execute()
-                else:
-                    should_save_options = False
-
-            if should_save_options:
-                for i in range(options_count):
-                    if str(options_form[i]).strip() != "":
-                        prediction_option = PredictionOption()
-                        prediction_option.prediction = prediction
-                        prediction_option.number = i + 1
-                        prediction_option.option = options_form[i]
-                        prediction_option.save()
+            save_prediction(prediction, options_form, prediction_options=prediction_options)
 
             st.success("Prediction saved" if is_new else "Prediction updated")
         except Exception as e:
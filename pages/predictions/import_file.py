@@ -0,0 +1,87 @@
+import streamlit as st
+
+from pages.predictions.commons import validate_values
+from src.model.Prediction import Prediction
+from src.model.exceptions.ValidationException import ValidationException
+from src.service.prediction_service import parse_prediction_records, get_prediction_from_record, import_predictions, \
+    get_existing_questions
+
+
+def main() -> None:
+    """
+    Import predictions function
+    :return:
+    """
+
+    key_suffix = "_import"
+
+    st.caption("Fields: question, options, type, send_date, end_date, refund_wager, allow_multiple_choices, "
+               "can_withdraw_bet. In CSV the options are separated by |, dates are like 2024-01-31 11:00")
+    file = st.file_uploader("CSV or JSON file", type=["csv", "json"], key=f"file{key_suffix}")
+    if file is None:
+        return
+
+    try:
+        records = parse_prediction_records(file.name, file.getvalue())
+    except ValidationException as ve:
+        st.error(ve.message)
+        return
+
+    predictions, errors = validate_records(records)
+
+    col_valid, col_invalid = st.columns(2)
+    col_valid.metric("Valid rows", "{0:,}".format(len(predictions)))
+    col_invalid.metric("Rows with errors", "{0:,}".format(len(errors)))
+
+    if len(errors) > 0:
+        st.dataframe([{"Row": row_number, "Question": question, "Error": error}
+                      for row_number, question, error in errors], use_container_width=True)
+
+    if st.button("Import", key=f"import{key_suffix}", disabled=(len(predictions) == 0)):
+        try:
+            imported_count = import_predictions(predictions)
+            st.success(f"{imported_count:,} predictions imported")
+        except Exception as e:
+            st.error(f"Error importing the predictions: {e}")
+
+
+def validate_records(records: list[dict]) -> tuple[list[tuple[Prediction, list[str]]], list[tuple[int, str, str]]]:
+    """
+    Validates each record with the rules of the add form, so that an invalid row does not abort the whole import.
+    The questions of all the rows are looked up at once before the rows are validated
+    :param records: The records
+    :return: The valid predictions with their option texts, and the row number, question and error of the invalid ones
+    """
+
+    errors: list[tuple[int, str, str]] = []
+    parsed_records: list[tuple[int, Prediction, list[str]]] = []
+    for row_number, record in enumerate(records, start=1):
+        try:
+            prediction, options = get_prediction_from_record(record)
+            parsed_records.append((row_number, prediction, options))
+        except ValidationException as ve:
+            errors.append((row_number, str(record.get("question") or ""), ve.message))
+
+    existing_questions = get_existing_questions([prediction.question for _, prediction, _ in parsed_records
+                                                 if prediction.question != ""])
+
+    predictions: list[tuple[Prediction, list[str]]] = []
+    questions: set[str] = set()
+    for row_number, prediction, options in parsed_records:
+        try:
+            validate_values(None, prediction.question, options, prediction.send_date, prediction.end_date, None,
+                            prediction.allow_multiple_choices, prediction.refund_wager, check_duplicate=False)
+
+            # Same question, ignoring case like the stored questions
+            question = prediction.question.lower()
+            if question in existing_questions:
+                raise ValidationException("A prediction with the same question already exists")
+            if question in questions:
+                raise ValidationException("A prediction with the same question is already in the file")
+            questions.add(question)
+
+            predictions.append((prediction, options))
+        except ValidationException as ve:
+            errors.append((row_number, prediction.question, ve.message))
+
+    return predictions, sorted(errors)
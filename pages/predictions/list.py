@@ -1,5 +1,6 @@
 import streamlit as st
 
+from pages.commons.util import get_paginated, show_page_navigation, reset_page_cursor
 from pages.predictions.commons import get_add_form_optionals, get_add_form, save
 from src.model.Prediction import Prediction
 from src.model.PredictionOption import PredictionOption
@@ -7,6 +8,7 @@ from src.model.enums.PredictionStatus import PredictionStatus, get_all_predictio
     get_active_prediction_status_names, get_prediction_status_by_list_of_names, get_prediction_status_name_by_key
 from src.model.tgrest.TgRestPrediction import TgRestPrediction, TgRestPredictionAction
 from src.service.form_service import get_session_state_key
+from src.service.prediction_service import get_options_by_prediction, set_correct_options
 from src.service.tg_rest_service import send_tg_rest
 
 
@@ -20,22 +22,25 @@ def main() -> None:
 
     # Filter by status multiselect
     status_filter = st.multiselect("Status filter", get_all_prediction_status_names(),
-                                   default=get_active_prediction_status_names())
+                                   default=get_active_prediction_status_names(), on_change=reset_page_cursor,
+                                   args=[key_suffix])
     selected_statuses = get_prediction_status_by_list_of_names(status_filter)
 
     # Filter by name text input
-    question_filter = st.text_input("Question filter", "")
+    question_filter = st.text_input("Question filter", "", on_change=reset_page_cursor, args=[key_suffix])
 
     # Get predictions
-    predictions = Prediction.select().where((Prediction.status.in_(selected_statuses))
-                                            & (Prediction.question.contains(question_filter)))
+    query = Prediction.get_by_status_and_question_filter(selected_statuses, question_filter)
+    page = get_paginated(query, Prediction.id, key_suffix)
+    predictions: list[Prediction] = page.items
+    options_by_prediction: dict[int, list[PredictionOption]] = get_options_by_prediction(predictions)
 
-    for index, prediction in enumerate(predictions):
-        key_suffix_list = f"{key_suffix}_{index}"
+    for prediction in predictions:
+        key_suffix_list = f"{key_suffix}_{prediction.id}"
+        prediction_options: list[PredictionOption] = options_by_prediction[prediction.id]
 
         with st.expander(prediction.question):
             st.info(get_prediction_status_name_by_key(prediction.status))
-            prediction_options = prediction.prediction_options
             options_count, should_send, should_end, should_cut_off, default_time_value = \
                 get_add_form_optionals(key_suffix_list, prediction=prediction, prediction_options=prediction_options)
 
@@ -72,17 +77,19 @@ def main() -> None:
                                                                            key=f"no_correct_option{key_suffix_list}",
                                                                            value=False)
                     # Correct options multiselect
-                    options = [o.option for o in prediction.prediction_options]
+                    options = [o.option for o in prediction_options]
                     correct_options_container.multiselect("Correct options", options,
                                                           key=f"correct_options{key_suffix_list}",
                                                           disabled=no_correct_option)
 
                     cols_close_set_results[0].button("Set Results", key=f"set{key_suffix_list}", on_click=set_results,
-                                                     args=[prediction, key_suffix_list])
+                                                     args=[prediction, prediction_options, key_suffix_list])
 
                 cols_close_set_results[1].button("Resend", key=f"delete{key_suffix_list}", on_click=resend,
                                                  args=[prediction])
 
+    show_page_navigation(page, key_suffix)
+
 
 def send(prediction: Prediction) -> None:
     """
@@ -131,10 +138,11 @@ def close_bets(prediction: Prediction) -> None:
                          "Prediction scheduled for closing, refresh the page")
 
 
-def set_results(prediction: Prediction, key_suffix: str) -> None:
+def set_results(prediction: Prediction, prediction_options: list[PredictionOption], key_suffix: str) -> None:
     """
     Set results function
     :param prediction: Prediction
+    :param prediction_options: The prediction options
     :param key_suffix: Key suffix
     :return:
     """
@@ -155,10 +163,10 @@ def set_results(prediction: Prediction, key_suffix: str) -> None:
         return
 
     # Save correct options
-    for correct_option in correct_options:
-        prediction_option = prediction.prediction_options.filter(PredictionOption.option == correct_option).first()
-        prediction_option.is_correct = True
-        prediction_option.save()
+    correct_option_ids = [o.id for o in prediction_options if o.option in correct_options]
+    if not set_correct_options(prediction, correct_option_ids):
+        st.error("This prediction results have already been set")
+        return
 
     send_tg_rest_command(prediction, TgRestPredictionAction.SET_RESULTS,
                          "Prediction scheduled for results set, refresh the page")
@@ -0,0 +1,110 @@
+import datetime
+
+import streamlit as st
+
+from pages.commons.util import reset_page_cursor
+from src.model.Crew import Crew
+from src.model.filter.UserFilter import UserFilter
+from src.service.user_service import get_facet_counts
+
+
+def show_and_get_user_filter(key_suffix: str) -> UserFilter:
+    """
+    Show the facet filters and get the user filter
+    :param key_suffix: Key suffix
+    :return: The user filter
+    """
+
+    user_filter = UserFilter()
+
+    with st.expander("Filters"):
+        # Range facets, applied first so that the counts of the other facets reflect them
+        col_min_bounty, col_max_bounty = st.columns(2)
+        min_bounty = col_min_bounty.number_input("Min bounty", min_value=0, value=0, step=1000000,
+                                                 key=f"min_bounty{key_suffix}", on_change=reset_page_cursor,
+                                                 args=[key_suffix])
+        max_bounty = col_max_bounty.number_input("Max bounty", min_value=0, value=0, step=1000000,
+                                                 key=f"max_bounty{key_suffix}", on_change=reset_page_cursor,
+                                                 args=[key_suffix], help="0 for no limit")
+        user_filter.min_bounty = min_bounty if min_bounty > 0 else None
+        user_filter.max_bounty = max_bounty if max_bounty > 0 else None
+
+        if st.checkbox("Filter by join date", key=f"filter_join_date{key_suffix}", on_change=reset_page_cursor,
+                       args=[key_suffix]):
+            today = datetime.date.today()
+            join_dates = st.date_input("Join date", value=(today - datetime.timedelta(days=30), today),
+                                       key=f"join_date{key_suffix}", on_change=reset_page_cursor, args=[key_suffix])
+            # While picking the range only the first date is set
+            if len(join_dates) == 2:
+                user_filter.join_date_from, user_filter.join_date_to = join_dates
+
+        # Value facets, each with the number of users matching its values given the selection of the others
+        user_filter.crew_id = st.session_state.get(get_facet_key("Crew", key_suffix))
+        user_filter.location_level = st.session_state.get(get_facet_key("Location level", key_suffix))
+        user_filter.is_active = st.session_state.get(get_facet_key("Active", key_suffix))
+        user_filter.is_admin = st.session_state.get(get_facet_key("Admin", key_suffix))
+
+        col_crew, col_location_level = st.columns(2)
+        col_is_active, col_is_admin = st.columns(2)
+
+        crew_counts = get_facet_counts(user_filter, UserFilter.CREW)
+        crew_names: dict[int, str] = {crew_id: name for crew_id, name in (
+            Crew.select(Crew.id, Crew.name).where(Crew.id.in_([i for i in crew_counts if i is not None])).tuples())}
+        user_filter.crew_id = show_facet_select_box(
+            col_crew, "Crew", crew_counts, sorted(crew_names, key=lambda crew_id: crew_names[crew_id]),
+            lambda crew_id: crew_names.get(crew_id, str(crew_id)), key_suffix)
+
+        location_level_counts = get_facet_counts(user_filter, UserFilter.LOCATION_LEVEL)
+        user_filter.location_level = show_facet_select_box(
+            col_location_level, "Location level", location_level_counts, sorted(location_level_counts),
+            str, key_suffix)
+
+        is_active_counts = get_facet_counts(user_filter, UserFilter.IS_ACTIVE)
+        user_filter.is_active = show_facet_select_box(
+            col_is_active, "Active", is_active_counts, [True, False], lambda value: "Yes" if value else "No",
+            key_suffix)
+
+        is_admin_counts = get_facet_counts(user_filter, UserFilter.IS_ADMIN)
+        user_filter.is_admin = show_facet_select_box(
+            col_is_admin, "Admin", is_admin_counts, [True, False], lambda value: "Yes" if value else "No",
+            key_suffix)
+
+    return user_filter
+
+
+def show_facet_select_box(container, label: str, counts: dict[any, int], values: list, format_value: callable,
+                          key_suffix: str) -> any:
+    """
+    Show a select box of the values of a facet with their number of users
+    :param container: The container to show the select box in
+    :param label: The label
+    :param counts: The number of users by value
+    :param values: The values, in display order
+    :param format_value: Function formatting a value
+    :param key_suffix: Key suffix
+    :return: The selected value, None for any
+    """
+
+    key = get_facet_key(label, key_suffix)
+
+    # Keep the selected value among the options even if no user matches it anymore
+    selected_value = st.session_state.get(key)
+    options = [None] + values
+    if selected_value not in options:
+        options.append(selected_value)
+
+    return container.selectbox(
+        label, options, key=key, on_change=reset_page_cursor, args=[key_suffix],
+        format_func=lambda value: ("Any ({0:,})".format(sum(counts.values())) if value is None
+                                   else "{0} ({1:,})".format(format_value(value), counts.get(value, 0))))
+
+
+def get_facet_key(label: str, key_suffix: str) -> str:
+    """
+    Get the session state key of a facet select box
+    :param label: The label of the facet
+    :param key_suffix: Key suffix
+    :return: The key
+    """
+
+    return f"facet_{label.lower().replace(' ', '_')}{key_suffix}"
@@ -0,0 +1,44 @@
+import streamlit as st
+
+import resources.Environment as Env
+from src.model.User import User
+from src.service.timeline_service import get_timeline
+
+
+def main(user: User) -> None:
+    """
+    Timeline function
+    :param user: The user
+    :return: None
+    """
+
+    key_suffix = f"_timeline_{user.id}"
+    count_key = f"count{key_suffix}"
+    page_size = Env.MAX_ITEMS_DISPLAYED_LIST.get_int()
+
+    count = st.session_state.get(count_key, page_size)
+    # One more event to know if there are others
+    events = get_timeline(user.id, count + 1)
+
+    if len(events) == 0:
+        st.info("No events")
+        return
+
+    for event in events[:count]:
+        st.markdown(f"**{event.date_time}** · {event.source} · {event.title}")
+        if event.details is not None:
+            st.caption(event.details)
+
+    if len(events) > count:
+        st.button("Show more", key=f"show_more{key_suffix}", on_click=show_more, args=[count_key, count + page_size])
+
+
+def show_more(count_key: str, count: int) -> None:
+    """
+    Show more events
+    :param count_key: The session state key of the number of events
+    :param count: The new number of events
+    :return: None
+    """
+
+    st.session_state[count_key] = count
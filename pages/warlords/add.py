@@ -3,6 +3,7 @@ import streamlit as st
 from pages.commons.util import select_user_select_box, get_selected_user
 from pages.warlords.commons import show_add_form, save
 from src.model.User import User
+from src.model.projection.UserListRow import UserListRow
 
 
 def main() -> None:
@@ -15,7 +16,7 @@ def main() -> None:
 
     # User
     selected_user_display_name, users_display_name_map = select_user_select_box(key_suffix)
-    selected_user: User = get_selected_user(selected_user_display_name, users_display_name_map)
+    selected_user: UserListRow = get_selected_user(selected_user_display_name, users_display_name_map)
 
     if selected_user:
         with st.form("warlord_add_form", clear_on_submit=False):
@@ -23,4 +24,4 @@ def main() -> None:
 
             submitted = st.form_submit_button("Save")
             if submitted:
-                save(key_suffix, selected_user, None)
+                save(key_suffix, User.get_by_id(selected_user.id), None)
@@ -2,6 +2,7 @@ from datetime import datetime
 
 import streamlit as st
 
+from pages.commons.util import get_paginated, show_page_navigation, reset_page_cursor
 from pages.warlords.commons import show_add_form, save
 from src.model.User import User
 from src.model.Warlord import Warlord
@@ -18,21 +19,24 @@ def main() -> None:
     key_suffix = "_list"
 
     # Only active checkbox
-    only_active = st.checkbox("Only active", value=True)
+    only_active = st.checkbox("Only active", value=True, on_change=reset_page_cursor, args=[key_suffix])
 
     # Filter records by first name, last name, username, user id, epithet, reason
     filter_by = st.text_input(
-        label="Search", key=f"filter_by{key_suffix}",
+        label="Search", key=f"filter_by{key_suffix}", on_change=reset_page_cursor, args=[key_suffix],
         help="Search by first name, last name, username, user id, epithet, reason")
 
     # Get warlords
     if len(filter_by) > 1:
-        warlords: list[Warlord] = Warlord.get_by_string_filter(filter_by, only_active=only_active)
+        query = Warlord.get_by_string_filter(filter_by, only_active=only_active)
     else:
-        warlords: list[Warlord] = Warlord.get_all(only_active=only_active)
+        query = Warlord.get_all(only_active=only_active)
 
-    for index, warlord in enumerate(warlords):
-        key_suffix_list = f"{key_suffix}_{index}"
+    page = get_paginated(query, Warlord.date, key_suffix)
+    warlords: list[Warlord] = page.items
+
+    for warlord in warlords:
+        key_suffix_list = f"{key_suffix}_{warlord.id}"
 
         user: User = warlord.user
         with st.expander(user.get_display_name()):
@@ -79,3 +83,5 @@ def main() -> None:
 
                         tg_rest_message = TgRestWarlordRevocation(user.id, warlord.id)
                         send_tg_rest(tg_rest_message)
+
+    show_page_navigation(page, key_suffix)
@@ -121,5 +121,42 @@ DEVIL_FRUIT_CATEGORY_MYTHICAL_ZOAN_SUM = Environment('DEVIL_FRUIT_CATEGORY_MYTHI
 # Maximum items displayed in a list. Default: 10
 MAX_ITEMS_DISPLAYED_LIST = Environment('MAX_ITEMS_DISPLAYED_LIST', default_value='5')
 
+# Seconds user search results are reused for. Default: 60
+USER_SEARCH_CACHE_TTL = Environment('USER_SEARCH_CACHE_TTL', default_value='60')
+
+# Seconds a user search waits for the same search running in another session before querying on its own. Default: 5
+USER_SEARCH_WAIT_TIMEOUT = Environment('USER_SEARCH_WAIT_TIMEOUT', default_value='5')
+
+# Seconds user filter facet counts are reused for. Default: 30
+USER_FACET_CACHE_TTL = Environment('USER_FACET_CACHE_TTL', default_value='30')
+
+# Seconds the number of users with a running timer is reused for. Default: 30
+COOLDOWN_COUNT_CACHE_TTL = Environment('COOLDOWN_COUNT_CACHE_TTL', default_value='30')
+
+# Seconds the leaderboard ranks are reused for before being recomputed. Default: 300
+LEADERBOARD_REFRESH_INTERVAL = Environment('LEADERBOARD_REFRESH_INTERVAL', default_value='300')
+
+# Seconds the statistics pages reuse their results for before recomputing them. Default: 300
+STATISTICS_REFRESH_INTERVAL = Environment('STATISTICS_REFRESH_INTERVAL', default_value='300')
+
+# Seconds after which an Impel Down log is added to the statistics, so that logs of transactions still open are not
+# skipped. Default: 60
+IMPEL_DOWN_STATISTICS_DELAY = Environment('IMPEL_DOWN_STATISTICS_DELAY', default_value='60')
+
+# Number of users updated by each statement of a bulk bounty adjustment. Default: 1000
+BULK_ADJUSTMENT_CHUNK_SIZE = Environment('BULK_ADJUSTMENT_CHUNK_SIZE', default_value='1000')
+
+# Number of notifications sent at the same time by bulk operations. Default: 4
+BULK_NOTIFICATION_WORKERS = Environment('BULK_NOTIFICATION_WORKERS', default_value='4')
+
+# Age in days after which Impel Down logs are moved to the archive. Default: 180
+IMPEL_DOWN_LOG_ARCHIVE_AGE_DAYS = Environment('IMPEL_DOWN_LOG_ARCHIVE_AGE_DAYS', default_value='180')
+
+# Number of Impel Down logs moved to the archive by each transaction. Default: 1000
+IMPEL_DOWN_LOG_ARCHIVE_CHUNK_SIZE = Environment('IMPEL_DOWN_LOG_ARCHIVE_CHUNK_SIZE', default_value='1000')
+
+# Number of rows inserted by each statement of a prediction import. Default: 500
+PREDICTION_IMPORT_CHUNK_SIZE = Environment('PREDICTION_IMPORT_CHUNK_SIZE', default_value='500')
+
 # Maximum number of Warlords. Default: 7
 MAX_WARLORDS = Environment('MAX_WARLORDS', default_value='7')
@@ -0,0 +1,36 @@
+from datetime import datetime
+
+from peewee import *
+
+from src.model.BaseModel import BaseModel
+from src.model.User import User
+
+
+class ImpelDownLogArchive(BaseModel):
+    """
+    Impel Down Log Archive class, the Impel Down logs moved out of the log table once old.
+    Same columns as the log table, keeping the original ids
+    """
+    id = IntegerField(primary_key=True)
+    user = ForeignKeyField(User, backref="+", on_delete="CASCADE", on_update="CASCADE")
+    sentence_type = CharField(max_length=99, null=True)
+    source = CharField(max_length=10, null=True)
+    date_time = DateTimeField(default=datetime.now)
+    release_date_time = DateTimeField(null=True)
+    is_permanent = BooleanField(default=False)
+    bounty_action = CharField(max_length=99, null=True)
+    reason = CharField(max_length=999, null=True)
+    previous_bounty = BigIntegerField(null=True)
+    new_bounty = BigIntegerField(null=True)
+    message_sent = BooleanField(default=False)
+    is_reversed = BooleanField(default=False)
+    external_id = IntegerField(null=True)
+    bail_amount = BigIntegerField(null=True)
+    bail_date = DateTimeField(null=True)
+    bail_payer: User | ForeignKeyField = ForeignKeyField(User, backref="+", null=True, on_delete="RESTRICT")
+
+    class Meta:
+        db_table = 'impel_down_log_archive'
+
+
+ImpelDownLogArchive.create_table()
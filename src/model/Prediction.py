@@ -1,7 +1,10 @@
 from peewee import *
+from peewee import ModelSelect, Function
+from playhouse.mysql_ext import Match
 
 from src.model.BaseModel import BaseModel
 from src.model.enums.PredictionStatus import PredictionStatus
+from src.service.db_service import get_full_text_phrase
 
 
 class Prediction(BaseModel):
@@ -24,5 +27,48 @@ class Prediction(BaseModel):
     class Meta:
         db_table = 'prediction'
 
+    @staticmethod
+    def get_question_hash(question: str) -> Function:
+        """
+        Gets the expression of the normalised question hash, computed by the database like the question_hash column
+        :param question: The question
+        :return: The hash expression
+        """
+
+        return fn.UNHEX(fn.MD5(fn.LOWER(fn.TRIM(question))))
+
+    @staticmethod
+    def get_by_question(question: str) -> 'Prediction':
+        """
+        Gets the prediction with the same question, ignoring case and surrounding spaces, with a seek on the question
+        hash index
+        :param question: The question
+        :return: The prediction or None
+        """
+
+        return (Prediction
+                .select()
+                .where(SQL("question_hash") == Prediction.get_question_hash(question))
+                .first())
+
+    @staticmethod
+    def get_by_status_and_question_filter(statuses: list[PredictionStatus], question_filter: str) -> ModelSelect:
+        """
+        Gets the predictions with the given statuses, filtered by question through the ngram full-text index.
+        Filters shorter than the ngram size are ignored, so an empty filter adds no predicate
+        :param statuses: The statuses
+        :param question_filter: The question filter
+        :return: The predictions query
+        """
+
+        query = Prediction.select().where(Prediction.status.in_(statuses))
+
+        question_filter = question_filter.strip()
+        if len(question_filter) > 1:
+            query = query.where(Match(Prediction.question, get_full_text_phrase(question_filter),
+                                      modifier="IN BOOLEAN MODE"))
+
+        return query
+
 
 Prediction.create_table()
@@ -1,9 +1,12 @@
 import datetime
 
 from peewee import *
+from peewee import ModelSelect
+from playhouse.mysql_ext import Match
 
 from src.model.BaseModel import BaseModel
 from src.model.Crew import Crew
+from src.service.db_service import get_full_text_phrase
 
 
 class User(BaseModel):
@@ -102,18 +105,28 @@ class User(BaseModel):
                                  " - " + self.tg_user_id if add_user_id else "")
 
     @staticmethod
-    def get_by_string_filter(filter_by: str) -> list['User']:
+    def get_string_filter_query(filter_by: str) -> ModelSelect:
         """
-        Gets users by string filter, searching by first name, last name, username or user id
+        Gets the query of the users matching a string filter, searching by first name, last name, username or user id.
+        Numeric filters are matched exactly against the user id, filters starting with @ by username prefix and all
+        the others through the ngram full-text index, so that no filter requires a table scan
         :param filter_by: Filter by
-        :return: Users
+        :return: The users query
         """
 
-        return User.select().where((User.tg_first_name.contains(filter_by)) |
-                                   (User.tg_last_name.contains(filter_by)) |
-                                   (User.tg_username.contains(filter_by)) |
-                                   (User.tg_user_id.contains(filter_by))
-                                   ).order_by(User.tg_first_name.desc()).limit(10)
+        filter_by = filter_by.strip()
+
+        # Telegram user id, exact match on the unique index
+        if filter_by.isdigit():
+            return User.select().where(User.tg_user_id == filter_by)
+
+        # Username, prefix match on the username index
+        if filter_by.startswith("@"):
+            return User.select().where(User.tg_username.startswith(filter_by[1:])).order_by(User.tg_username)
+
+        relevance = Match((User.tg_first_name, User.tg_last_name, User.tg_username),
+                          get_full_text_phrase(filter_by), modifier="IN BOOLEAN MODE")
+        return User.select().where(relevance).order_by(relevance.desc())
 
     def is_warlord(self) -> bool:
         """
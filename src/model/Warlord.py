@@ -1,9 +1,11 @@
 import datetime
 
 from peewee import *
+from peewee import ModelSelect
 
 from src.model.BaseModel import BaseModel
 from src.model.User import User
+from src.model.projection.UserListRow import UserListRow
 
 
 class Warlord(BaseModel):
@@ -23,10 +25,10 @@ class Warlord(BaseModel):
         db_table = 'warlord'
 
     @staticmethod
-    def get_active() -> list['Warlord']:
+    def get_active() -> ModelSelect:
         """
         Get active warlords
-        :return: Active warlords
+        :return: Active warlords query
         """
 
         return (Warlord
@@ -43,10 +45,10 @@ class Warlord(BaseModel):
         return len(Warlord.get_active())
 
     @staticmethod
-    def get_active_order_by_bounty() -> list['Warlord']:
+    def get_active_order_by_bounty() -> ModelSelect:
         """
-        Get active warlords
-        :return: Active warlords
+        Get active warlords, sorted by bounty
+        :return: Active warlords query
         """
 
         return (Warlord
@@ -88,42 +90,44 @@ class Warlord(BaseModel):
         return self.date + datetime.timedelta(days=duration_days)
 
     @staticmethod
-    def get_by_string_filter(filter_by: str, only_active: bool = True) -> list['Warlord']:
+    def get_by_string_filter(filter_by: str, only_active: bool = True) -> ModelSelect:
         """
-        Gets warlords by string filter, searching by first name, last name, username, user id, epithet, reason
+        Gets warlords by string filter, searching by first name, last name, username, user id, epithet, reason.
+        Only the list columns of the user are loaded
         :param filter_by: Filter by
         :param only_active: Only active
-        :return: Warlords
+        :return: Warlords query
         """
 
         query = (Warlord
-                 .select()
+                 .select(Warlord, *UserListRow.get_fields())
                  .join(User)
                  .where((User.tg_first_name.contains(filter_by)) |
                         (User.tg_last_name.contains(filter_by)) |
                         (User.tg_username.contains(filter_by)) |
                         (User.tg_user_id.contains(filter_by)) |
                         (Warlord.epithet.contains(filter_by)) |
-                        (Warlord.reason.contains(filter_by))
-                        ).limit(10))
+                        (Warlord.reason.contains(filter_by))))
 
         if only_active:
             query = query.where(Warlord.end_date > datetime.datetime.now())
 
-        return query.execute()
+        return query
 
     @staticmethod
-    def get_all(only_active: bool = True) -> list['Warlord']:
+    def get_all(only_active: bool = True) -> ModelSelect:
         """
-        Gets all warlords
+        Gets all warlords, loading only the list columns of the user
         :param only_active: Only active
-        :return: Warlords
+        :return: Warlords query
         """
 
+        query = Warlord.select(Warlord, *UserListRow.get_fields()).join(User).order_by(Warlord.date.desc())
+
         if only_active:
-            return Warlord.get_active()
+            return query.where(Warlord.end_date > datetime.datetime.now())
 
-        return Warlord.select().order_by(Warlord.date.desc()).execute()
+        return query
 
     def is_active(self) -> bool:
         """
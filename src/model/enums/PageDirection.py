@@ -0,0 +1,9 @@
+from strenum import StrEnum
+
+
+class PageDirection(StrEnum):
+    """
+    Enum for the direction of a keyset page cursor
+    """
+    NEXT = 'next'
+    PREVIOUS = 'previous'
@@ -0,0 +1,62 @@
+from strenum import StrEnum
+
+
+class UserTimer(StrEnum):
+    """
+    Enum for the time windows tracked on a user, the value is the end date column
+    """
+    FIGHT_IMMUNITY = 'fight_immunity_end_date'
+    FIGHT_COOLDOWN = 'fight_cooldown_end_date'
+    PLUNDER_IMMUNITY = 'plunder_immunity_end_date'
+    PLUNDER_COOLDOWN = 'plunder_cooldown_end_date'
+    DOC_Q_COOLDOWN = 'doc_q_cooldown_end_date'
+    GAME_COOLDOWN = 'game_cooldown_end_date'
+    PREDICTION_CREATION_COOLDOWN = 'prediction_creation_cooldown_end_date'
+    DEVIL_FRUIT_COLLECTION_COOLDOWN = 'devil_fruit_collection_cooldown_end_date'
+    BOUNTY_LOAN_ISSUE_COOLDOWN = 'bounty_loan_issue_cool_down_end_date'
+    CONSCRIPTION = 'conscription_end_date'
+
+    def get_description(self) -> str:
+        """
+        Get the description of the user timer
+        :return: The description of the user timer
+        """
+
+        return USER_TIMER_DESCRIPTION_MAP[self]
+
+    @staticmethod
+    def get_by_description(description: str) -> 'UserTimer':
+        """
+        Get the user timer by its description
+        :param description: The description of the user timer
+        :return: The user timer
+        """
+
+        for user_timer in UserTimer:
+            if user_timer.get_description() == description:
+                return user_timer
+
+        raise ValueError("Invalid user timer description: " + description)
+
+    @staticmethod
+    def get_all_description() -> list[str]:
+        """
+        Get all the descriptions of the user timers
+        :return: All the descriptions of the user timers
+        """
+
+        return [user_timer.get_description() for user_timer in UserTimer]
+
+
+USER_TIMER_DESCRIPTION_MAP = {
+    UserTimer.FIGHT_IMMUNITY: "Fight Immunity",
+    UserTimer.FIGHT_COOLDOWN: "Fight Cooldown",
+    UserTimer.PLUNDER_IMMUNITY: "Plunder Immunity",
+    UserTimer.PLUNDER_COOLDOWN: "Plunder Cooldown",
+    UserTimer.DOC_Q_COOLDOWN: "Doc Q Cooldown",
+    UserTimer.GAME_COOLDOWN: "Challenge Cooldown",
+    UserTimer.PREDICTION_CREATION_COOLDOWN: "Prediction Creation Cooldown",
+    UserTimer.DEVIL_FRUIT_COLLECTION_COOLDOWN: "Devil Fruit Collection Cooldown",
+    UserTimer.BOUNTY_LOAN_ISSUE_COOLDOWN: "Bounty Loan Issue Cooldown",
+    UserTimer.CONSCRIPTION: "Conscription"
+}
@@ -0,0 +1,5 @@
+class BulkAdjustmentException(Exception):
+    def __init__(self, message, updated_count: int):
+        self.message = message
+        self.updated_count = updated_count
+        super().__init__(message)
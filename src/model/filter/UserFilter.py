@@ -0,0 +1,102 @@
+import datetime
+
+from peewee import Expression, ModelSelect
+
+from src.model.User import User
+
+
+class UserFilter:
+    """
+    UserFilter class, the facets a list of users can be filtered by.
+    None values do not filter
+    """
+
+    BOUNTY = "bounty"
+    CREW = "crew"
+    LOCATION_LEVEL = "location_level"
+    JOIN_DATE = "join_date"
+    IS_ACTIVE = "is_active"
+    IS_ADMIN = "is_admin"
+
+    def __init__(self, min_bounty: int = None, max_bounty: int = None, crew_id: int = None,
+                 location_level: int = None, join_date_from: datetime.date = None,
+                 join_date_to: datetime.date = None, is_active: bool = None, is_admin: bool = None):
+        """
+        Constructor
+        :param min_bounty: The minimum bounty
+        :param max_bounty: The maximum bounty
+        :param crew_id: The crew id
+        :param location_level: The location level
+        :param join_date_from: The first join date, included
+        :param join_date_to: The last join date, included
+        :param is_active: If the user is active
+        :param is_admin: If the user is an admin
+        """
+
+        self.min_bounty: int | None = min_bounty
+        self.max_bounty: int | None = max_bounty
+        self.crew_id: int | None = crew_id
+        self.location_level: int | None = location_level
+        self.join_date_from: datetime.date | None = join_date_from
+        self.join_date_to: datetime.date | None = join_date_to
+        self.is_active: bool | None = is_active
+        self.is_admin: bool | None = is_admin
+
+    def get_conditions(self, excluded_facet: str = None) -> list[Expression]:
+        """
+        Gets the conditions of the filter
+        :param excluded_facet: A facet whose condition is left out, used to count the values of that facet
+        :return: The conditions
+        """
+
+        conditions: list[Expression] = []
+
+        if excluded_facet != self.BOUNTY:
+            if self.min_bounty is not None:
+                conditions.append(User.bounty >= self.min_bounty)
+            if self.max_bounty is not None:
+                conditions.append(User.bounty <= self.max_bounty)
+
+        if excluded_facet != self.CREW and self.crew_id is not None:
+            conditions.append(User.crew == self.crew_id)
+
+        if excluded_facet != self.LOCATION_LEVEL and self.location_level is not None:
+            conditions.append(User.location_level == self.location_level)
+
+        if excluded_facet != self.JOIN_DATE:
+            # Compare on the datetime column directly so that the join date index can be used
+            if self.join_date_from is not None:
+                conditions.append(User.join_date >= datetime.datetime.combine(self.join_date_from, datetime.time.min))
+            if self.join_date_to is not None:
+                conditions.append(User.join_date < datetime.datetime.combine(
+                    self.join_date_to + datetime.timedelta(days=1), datetime.time.min))
+
+        if excluded_facet != self.IS_ACTIVE and self.is_active is not None:
+            conditions.append(User.is_active == self.is_active)
+
+        if excluded_facet != self.IS_ADMIN and self.is_admin is not None:
+            conditions.append(User.is_admin == self.is_admin)
+
+        return conditions
+
+    def apply(self, query: ModelSelect, excluded_facet: str = None) -> ModelSelect:
+        """
+        Applies the filter to a users query
+        :param query: The query
+        :param excluded_facet: A facet whose condition is left out
+        :return: The filtered query
+        """
+
+        conditions = self.get_conditions(excluded_facet)
+        if len(conditions) == 0:
+            return query
+
+        return query.where(*conditions)
+
+    def is_empty(self) -> bool:
+        """
+        Returns True if the filter does not filter any user
+        :return: True if the filter is empty
+        """
+
+        return len(self.get_conditions()) == 0
@@ -0,0 +1,21 @@
+from src.model.enums.PageDirection import PageDirection
+
+
+class KeysetPage:
+    """
+    KeysetPage class, a page of items fetched with keyset pagination.
+    Cursors are tuples of (direction, sort value, id) pointing to the first or last item of the page
+    """
+
+    def __init__(self, items: list, previous_cursor: tuple[PageDirection, any, int] | None,
+                 next_cursor: tuple[PageDirection, any, int] | None):
+        """
+        Constructor
+        :param items: The items of the page
+        :param previous_cursor: The cursor of the previous page, None if this is the first page
+        :param next_cursor: The cursor of the next page, None if this is the last page
+        """
+
+        self.items: list = items
+        self.previous_cursor: tuple[PageDirection, any, int] | None = previous_cursor
+        self.next_cursor: tuple[PageDirection, any, int] | None = next_cursor
@@ -0,0 +1,77 @@
+import datetime
+
+from peewee import Field, ModelSelect
+
+from src.model.User import User
+
+
+class UserListRow:
+    """
+    UserListRow class, the subset of the User columns needed to show a user in a list.
+    The full User is only loaded when it has to be edited
+    """
+
+    __slots__ = ('id', 'tg_user_id', 'tg_first_name', 'tg_last_name', 'tg_username', 'bounty', 'last_message_date',
+                 'impel_down_release_date', 'impel_down_is_permanent', 'crew_id')
+
+    def __init__(self, **columns):
+        """
+        Constructor
+        :param columns: The column values, by column name
+        """
+
+        self.id: int = columns.get('id')
+        self.tg_user_id: str = columns.get('tg_user_id')
+        self.tg_first_name: str = columns.get('tg_first_name')
+        self.tg_last_name: str = columns.get('tg_last_name')
+        self.tg_username: str = columns.get('tg_username')
+        self.bounty: int = columns.get('bounty')
+        self.last_message_date: datetime.datetime = columns.get('last_message_date')
+        self.impel_down_release_date: datetime.datetime = columns.get('impel_down_release_date')
+        self.impel_down_is_permanent: bool = columns.get('impel_down_is_permanent')
+        self.crew_id: int = columns.get('crew')
+
+    @staticmethod
+    def get_fields(model: type[User] = User) -> list[Field]:
+        """
+        Gets the projected fields
+        :param model: The User model or one of its aliases
+        :return: The fields
+        """
+
+        return [getattr(model, column) for column in UserListRow.__slots__]
+
+    @staticmethod
+    def from_query(query: ModelSelect) -> ModelSelect:
+        """
+        Restricts a User query to the projected columns
+        :param query: The User query
+        :return: The query returning UserListRow items
+        """
+
+        return query.select(*UserListRow.get_fields()).objects(UserListRow)
+
+    def get_bounty_formatted(self) -> str:
+        """
+        Returns a formatted string of the bounty
+        :return: The formatted string e.g. 1,000,000
+        """
+
+        return User.get_bounty_formatted(self)
+
+    def is_arrested(self) -> bool:
+        """
+        Returns True if the user is arrested
+        :return: True if the user is arrested
+        """
+
+        return User.is_arrested(self)
+
+    def get_display_name(self, add_user_id: bool = False) -> str:
+        """
+        Gets the user display name
+        :param add_user_id: Add user id
+        :return: User display name
+        """
+
+        return User.get_display_name(self, add_user_id)
@@ -0,0 +1,23 @@
+import datetime
+import threading
+
+
+class ImpelDownDailySummary:
+    """
+    ImpelDownDailySummary class, the aggregated Impel Down logs by day and source up to a log date watermark.
+    Only facts that do not change once a log is written are kept, so the summary is extended with the logs after the
+    watermark instead of being recomputed
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+
+        # Logs written before this date have been aggregated, None if none yet
+        self.watermark: datetime.datetime | None = None
+        # If the archived logs have been aggregated
+        self.is_archive_aggregated: bool = False
+        # Sentences, bounty erased and bounty halved, by (day, source)
+        self.rows: dict[tuple[datetime.date, str], list[int]] = {}
+        self.lock: threading.Lock = threading.Lock()
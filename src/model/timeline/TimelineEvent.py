@@ -0,0 +1,25 @@
+import datetime
+
+
+class TimelineEvent:
+    """
+    TimelineEvent class, an event of a user timeline
+    """
+
+    __slots__ = ('date_time', 'source', 'record_id', 'title', 'details')
+
+    def __init__(self, date_time: datetime.datetime, source: str, record_id: int, title: str, details: str = None):
+        """
+        Constructor
+        :param date_time: When the event happened
+        :param source: The source of the event, e.g. Impel Down
+        :param record_id: The id of the source record
+        :param title: The title
+        :param details: The details, if any
+        """
+
+        self.date_time: datetime.datetime = date_time
+        self.source: str = source
+        self.record_id: int = record_id
+        self.title: str = title
+        self.details: str | None = details
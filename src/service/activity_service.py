@@ -0,0 +1,74 @@
+import datetime
+
+import streamlit as st
+from peewee import fn, Case
+
+import resources.Environment as Env
+from src.model.User import User
+
+ACTIVE_PERIODS_DAYS = {"DAU": 1, "WAU": 7, "MAU": 30}
+WEEKDAYS = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+
+
+@st.cache_data(ttl=Env.STATISTICS_REFRESH_INTERVAL.get_int(), show_spinner=False)
+def get_active_users_counts() -> dict[str, dict[str, int]]:
+    """
+    Gets the number of active users in the last day, week and month, counted by the database on the date indexes
+    :return: The counts by period name, for group messages and for bot interactions
+    """
+
+    now = datetime.datetime.now()
+    counts: dict[str, dict[str, int]] = {}
+
+    for description, date_field in [("Group messages", User.last_message_date),
+                                     ("Bot interactions", User.last_system_interaction_date)]:
+        # Only the users active in the longest period are read, the others are counted by conditional sums
+        longest_period_start = now - datetime.timedelta(days=max(ACTIVE_PERIODS_DAYS.values()))
+        row = (User.select(*[fn.SUM(Case(None, [(date_field >= now - datetime.timedelta(days=days), 1)], 0))
+                           for days in ACTIVE_PERIODS_DAYS.values()])
+               .where(date_field >= longest_period_start)
+               .tuples()
+               .first())
+
+        counts[description] = {name: int(count or 0) for name, count in zip(ACTIVE_PERIODS_DAYS.keys(), row)}
+
+    return counts
+
+
+@st.cache_data(ttl=Env.STATISTICS_REFRESH_INTERVAL.get_int(), show_spinner=False)
+def get_activity_heatmap(days: int) -> list[dict]:
+    """
+    Gets the number of users by weekday and hour of their last group message, bucketed by the database
+    :param days: Only the users whose last message is in the last given days
+    :return: The cells of the heatmap, with weekday, hour and users
+    """
+
+    weekday = fn.DAYOFWEEK(User.last_message_date)
+    hour = fn.HOUR(User.last_message_date)
+    query = (User.select(weekday, hour, fn.COUNT(User.id))
+             .where(User.last_message_date >= datetime.datetime.now() - datetime.timedelta(days=days))
+             .group_by(weekday, hour)
+             .tuples())
+
+    return [{"Weekday": WEEKDAYS[weekday_value - 1], "Hour": hour_value, "Users": count}
+            for weekday_value, hour_value, count in query]
+
+
+@st.cache_data(ttl=Env.STATISTICS_REFRESH_INTERVAL.get_int(), show_spinner=False)
+def get_join_cohorts(active_days: int) -> list[dict]:
+    """
+    Gets the users who joined each month and how many of them are still active, grouped by the database
+    :param active_days: Users are considered active if their last group message is in the last given days
+    :return: The cohorts, with month, joined users, active users and retention percentage
+    """
+
+    month = fn.DATE_FORMAT(User.join_date, "%Y-%m")
+    active_since = datetime.datetime.now() - datetime.timedelta(days=active_days)
+    query = (User.select(month, fn.COUNT(User.id), fn.SUM(Case(None, [(User.last_message_date >= active_since, 1)], 0)))
+             .group_by(month)
+             .order_by(month)
+             .tuples())
+
+    return [{"Month": month_value, "Joined": joined, "Active": int(active),
+             "Retention %": round(int(active) / joined * 100, 1)}
+            for month_value, joined, active in query]
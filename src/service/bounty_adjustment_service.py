@@ -0,0 +1,117 @@
+import csv
+import io
+
+import numpy as np
+from peewee import fn, ModelSelect
+
+import resources.Environment as Env
+from src.model.BaseModel import db_obj
+from src.model.User import User
+from src.model.exceptions.BulkAdjustmentException import BulkAdjustmentException
+from src.model.exceptions.ValidationException import ValidationException
+from src.service.db_service import stream_tuples
+
+
+def decode_csv(content: bytes) -> str:
+    """
+    Decodes an uploaded CSV file, encoded in UTF-8 with or without BOM
+    :param content: The file content
+    :return: The CSV text
+    """
+
+    try:
+        return content.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise ValidationException("The file must be encoded in UTF-8")
+
+
+def parse_tg_user_ids(csv_text: str) -> list[str]:
+    """
+    Parses the Telegram user ids from the first column of a CSV, skipping an optional header row
+    :param csv_text: The CSV text
+    :return: The distinct Telegram user ids, in file order
+    """
+
+    tg_user_ids: dict[str, None] = {}
+    for line_number, row in enumerate(csv.reader(io.StringIO(csv_text)), start=1):
+        # A BOM left by a pasted or already decoded text would turn the first id into a header
+        value = row[0].replace("\ufeff", "").strip() if len(row) > 0 else ""
+        if value == "":
+            continue
+
+        if not value.isdigit():
+            if line_number == 1:  # Header
+                continue
+
+            raise ValidationException(f"Invalid user id at line {line_number}: {value}")
+
+        tg_user_ids[value] = None
+
+    return list(tg_user_ids)
+
+
+def get_users_by_tg_user_ids(tg_user_ids: list[str]) -> ModelSelect:
+    """
+    Gets the users with the given Telegram user ids, as lookups on the unique index
+    :param tg_user_ids: The Telegram user ids
+    :return: The users query
+    """
+
+    return User.select().where(User.tg_user_id.in_(tg_user_ids))
+
+
+def get_target_bounties(query: ModelSelect) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the ids and bounties of the users of a query, streamed into arrays
+    :param query: The users query
+    :return: The user ids and their bounties
+    """
+
+    chunks = [np.array(rows, dtype=np.int64) for rows in stream_tuples(query.select(User.id, User.bounty))]
+    values = np.concatenate(chunks) if len(chunks) > 0 else np.empty((0, 2), dtype=np.int64)
+
+    return values[:, 0], values[:, 1]
+
+
+def get_adjusted_bounties(bounties: np.ndarray, amount: int) -> np.ndarray:
+    """
+    Gets the bounties after an adjustment, with the same rule applied by the database.
+    A penalty never brings a bounty below zero, and leaves an already negative bounty unchanged
+    :param bounties: The bounties
+    :param amount: The amount to add, negative for a penalty
+    :return: The adjusted bounties
+    """
+
+    if amount >= 0:
+        return bounties + amount
+
+    return np.maximum(bounties + amount, np.minimum(bounties, 0))
+
+
+def apply_bounty_adjustment(user_ids: np.ndarray, amount: int) -> int:
+    """
+    Adjusts the bounty of the users with set-based updates, one transaction per chunk of users.
+    The new bounty is computed by the database from the current one, so changes made since the preview are kept.
+    If a chunk fails the previous ones stay committed, and the exception tells how many users were adjusted
+    :param user_ids: The user ids
+    :param amount: The amount to add, negative for a penalty
+    :return: The number of updated users
+    """
+
+    if amount >= 0:
+        new_bounty = User.bounty + amount
+    else:
+        new_bounty = fn.GREATEST(User.bounty + amount, fn.LEAST(User.bounty, 0))
+
+    chunk_size = Env.BULK_ADJUSTMENT_CHUNK_SIZE.get_int()
+    updated_count = 0
+    for start in range(0, len(user_ids), chunk_size):
+        chunk = [int(user_id) for user_id in user_ids[start:start + chunk_size]]
+        try:
+            with db_obj.get_db().atomic():
+                updated_count += User.update(bounty=new_bounty).where(User.id.in_(chunk)).execute()
+        except Exception as e:
+            raise BulkAdjustmentException(f"Error adjusting the bounties after {updated_count:,} users: {e}",
+                                          updated_count) from e
+
+    return updated_count
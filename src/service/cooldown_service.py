@@ -0,0 +1,51 @@
+import datetime
+
+import streamlit as st
+from peewee import Field, ModelSelect
+
+import resources.Environment as Env
+from src.model.User import User
+from src.model.enums.UserTimer import UserTimer
+from src.model.projection.UserListRow import UserListRow
+
+
+def get_timer_field(timer: UserTimer) -> Field:
+    """
+    Gets the end date field of a user timer
+    :param timer: The user timer
+    :return: The end date field
+    """
+
+    return getattr(User, timer)
+
+
+def get_users_with_running_timer(timer: UserTimer, ends_within: datetime.timedelta = None) -> ModelSelect:
+    """
+    Gets the users whose timer is running, as a range on the end date index.
+    Only the list columns and the end date are loaded
+    :param timer: The user timer
+    :param ends_within: If not None, only the timers ending within this time
+    :return: The users query
+    """
+
+    field = get_timer_field(timer)
+    now = datetime.datetime.now()
+
+    query = User.select(*UserListRow.get_fields(), field).where(field > now)
+    if ends_within is not None:
+        query = query.where(field <= now + ends_within)
+
+    return query
+
+
+@st.cache_data(ttl=Env.COOLDOWN_COUNT_CACHE_TTL.get_int(), show_spinner=False)
+def count_users_with_running_timer(timer: UserTimer, ends_within: datetime.timedelta = None) -> int:
+    """
+    Counts the users whose timer is running, on the end date index. Reused for a short time, so that widget changes
+    that do not affect the filter do not count again
+    :param timer: The user timer
+    :param ends_within: If not None, only the timers ending within this time
+    :return: The number of users
+    """
+
+    return get_users_with_running_timer(timer, ends_within).count()
@@ -1,5 +1,7 @@
 import datetime
 
+import numpy as np
+
 
 def get_remaining_time_in_seconds(end_datetime: datetime, start_datetime: datetime = None) -> int:
     """
@@ -63,3 +65,41 @@ def get_datetime_in_future_days(days: int) -> datetime:
     """
 
     return get_datetime_in_future_hours(days * 24)
+
+
+def get_remaining_times_in_seconds(end_datetimes: list[datetime.datetime], start_datetime: datetime = None
+                                   ) -> np.ndarray:
+    """
+    Get the remaining time in seconds until each of the end_datetimes, computed at once
+    :param end_datetimes: The end datetimes, None values are considered already elapsed
+    :param start_datetime: The start datetime. If None, the current datetime is used
+    :return: The remaining times in seconds
+    """
+    if start_datetime is None:
+        start_datetime = datetime.datetime.now(datetime.timezone.utc)
+    start_datetime = start_datetime.replace(tzinfo=None)
+
+    # Remove offset awareness from end_datetimes
+    end_datetimes = np.array([end_datetime.replace(tzinfo=None) if end_datetime is not None else None
+                              for end_datetime in end_datetimes], dtype='datetime64[s]')
+
+    remaining_times = (end_datetimes - np.datetime64(start_datetime, 's')).astype(np.int64)
+
+    # If the end_datetime is in the past or not set, return 0
+    remaining_times[np.isnat(end_datetimes) | (remaining_times < 0)] = 0
+
+    return remaining_times
+
+
+def format_durations(seconds: np.ndarray) -> list[str]:
+    """
+    Format durations in seconds
+    :param seconds: The durations in seconds
+    :return: The formatted durations e.g. 1d 2h 3m
+    """
+
+    days, seconds = np.divmod(seconds, 86400)
+    hours, seconds = np.divmod(seconds, 3600)
+    minutes = seconds // 60
+
+    return [(f"{d}d " if d > 0 else "") + f"{h}h {m}m" for d, h, m in zip(days, hours, minutes)]
@@ -0,0 +1,167 @@
+from typing import Iterator
+
+from peewee import Model, ModelSelect
+from pymysql.cursors import SSCursor
+
+# Comment of the full-text indexes built without stopwords
+FULL_TEXT_INDEX_COMMENT = "ngram without stopwords"
+
+
+def index_exists(model: type[Model], index_name: str) -> bool:
+    """
+    Checks if an index exists on the model table
+    :param model: The model
+    :param index_name: The index name
+    :return: True if the index exists
+    """
+
+    cursor = model._meta.database.execute_sql(
+        "SELECT 1 FROM information_schema.STATISTICS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s LIMIT 1",
+        (model._meta.table_name, index_name))
+
+    return cursor.fetchone() is not None
+
+
+def get_index_comment(model: type[Model], index_name: str) -> str | None:
+    """
+    Gets the comment of an index on the model table
+    :param model: The model
+    :param index_name: The index name
+    :return: The comment, None if the index does not exist
+    """
+
+    cursor = model._meta.database.execute_sql(
+        "SELECT INDEX_COMMENT FROM information_schema.STATISTICS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s LIMIT 1",
+        (model._meta.table_name, index_name))
+
+    row = cursor.fetchone()
+    return row[0] if row is not None else None
+
+
+def ensure_index(model: type[Model], index_name: str, columns: list[str], index_type: str = "") -> None:
+    """
+    Creates an index on the model table if it does not exist yet.
+    Tables are created by the bot, so create_table() never adds indexes to them once they exist.
+    The index is built online, so the bot can keep writing to the table
+    :param model: The model
+    :param index_name: The index name
+    :param columns: The indexed columns
+    :param index_type: The index type, e.g. UNIQUE
+    :return: None
+    """
+
+    if index_exists(model, index_name):
+        return
+
+    index_sql = " ".join(part for part in ["ADD", index_type, "INDEX", f"`{index_name}`", get_columns_sql(columns)]
+                         if part != "")
+    model._meta.database.execute_sql(
+        f"ALTER TABLE `{model._meta.table_name}` {index_sql}, ALGORITHM=INPLACE, LOCK=NONE")
+
+
+def ensure_full_text_index(model: type[Model], index_name: str, columns: list[str]) -> None:
+    """
+    Creates an ngram full-text index on the model table if it does not exist yet, or rebuilds it if it was not built
+    by this function.
+    The default stopword list holds single letters such as "a" and "i", and the ngram parser skips every token that
+    contains a stopword, so the index is built with stopwords disabled, else names like "Nami" could never be found.
+    The index comment marks the indexes built this way. A full-text index only allows reads while it is built
+    :param model: The model
+    :param index_name: The index name
+    :param columns: The indexed columns
+    :return: None
+    """
+
+    comment = get_index_comment(model, index_name)
+    if comment == FULL_TEXT_INDEX_COMMENT:
+        return
+
+    database = model._meta.database
+    drop_sql = f"DROP INDEX `{index_name}`, " if comment is not None else ""
+    database.execute_sql("SET SESSION innodb_ft_enable_stopword = OFF")
+    try:
+        database.execute_sql(
+            f"ALTER TABLE `{model._meta.table_name}` {drop_sql}ADD FULLTEXT INDEX `{index_name}` "
+            f"{get_columns_sql(columns)} WITH PARSER ngram COMMENT '{FULL_TEXT_INDEX_COMMENT}', "
+            f"ALGORITHM=INPLACE, LOCK=SHARED")
+    finally:
+        database.execute_sql("SET SESSION innodb_ft_enable_stopword = ON")
+
+
+def get_columns_sql(columns: list[str]) -> str:
+    """
+    Gets the column list of an index definition
+    :param columns: The columns
+    :return: The column list, e.g. (`a`, `b`)
+    """
+
+    return "({})".format(", ".join(f"`{column}`" for column in columns))
+
+
+def column_exists(model: type[Model], column_name: str) -> bool:
+    """
+    Checks if a column exists on the model table
+    :param model: The model
+    :param column_name: The column name
+    :return: True if the column exists
+    """
+
+    cursor = model._meta.database.execute_sql(
+        "SELECT 1 FROM information_schema.COLUMNS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s LIMIT 1",
+        (model._meta.table_name, column_name))
+
+    return cursor.fetchone() is not None
+
+
+def ensure_column(model: type[Model], column_name: str, definition: str) -> None:
+    """
+    Adds a column to the model table if it does not exist yet, e.g. a generated column that is not a model field.
+    The column is added online, which is supported for a VIRTUAL generated column but not for a STORED one
+    :param model: The model
+    :param column_name: The column name
+    :param definition: The column definition, e.g. INT NOT NULL
+    :return: None
+    """
+
+    if column_exists(model, column_name):
+        return
+
+    model._meta.database.execute_sql(
+        f"ALTER TABLE `{model._meta.table_name}` ADD COLUMN `{column_name}` {definition}, ALGORITHM=INPLACE, LOCK=NONE")
+
+
+def get_full_text_phrase(text: str) -> str:
+    """
+    Gets a boolean mode full-text phrase from a free text, so that any operator typed by the user is ignored.
+    With the ngram parser a phrase matches any value containing the text
+    :param text: The text
+    :return: The full-text phrase
+    """
+
+    return '"{}"'.format(text.replace('"', ' ').strip())
+
+
+def stream_tuples(query: ModelSelect, chunk_size: int = 10000) -> Iterator[list[tuple]]:
+    """
+    Streams the rows of a query in chunks with a server-side cursor, so that the result set is never held in memory
+    at once. No other query can run on the connection until the stream is consumed
+    :param query: The query
+    :param chunk_size: The number of rows per chunk
+    :return: The chunks of rows
+    """
+
+    sql, params = query.sql()
+    cursor = query.model._meta.database.connection().cursor(SSCursor)
+    try:
+        cursor.execute(sql, params)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if len(rows) == 0:
+                break
+
+            yield rows
+    finally:
+        cursor.close()
@@ -0,0 +1,108 @@
+import math
+
+import numpy as np
+import streamlit as st
+
+import resources.Environment as Env
+from src.model.User import User
+from src.service.db_service import stream_tuples
+
+QUANTILES = [0.1, 0.25, 0.5, 0.75, 0.9, 0.99]
+
+
+def get_bounty_columns() -> dict[str, np.ndarray]:
+    """
+    Gets the bounty columns of all users, streamed into arrays without creating a model object per row
+    :return: The bounty, pending bounty and total gained bounty arrays, by column name
+    """
+
+    fields = [User.bounty, User.pending_bounty, User.total_gained_bounty]
+    chunks = [np.array(rows, dtype=np.int64) for rows in stream_tuples(User.select(*fields))]
+    values = np.concatenate(chunks) if len(chunks) > 0 else np.empty((0, len(fields)), dtype=np.int64)
+
+    return {field.name: values[:, index] for index, field in enumerate(fields)}
+
+
+@st.cache_data(ttl=Env.STATISTICS_REFRESH_INTERVAL.get_int(), show_spinner=False)
+def get_bounty_distributions() -> dict[str, dict]:
+    """
+    Gets the distribution statistics of the bounty columns, shared by all sessions and recomputed on a schedule.
+    Only the statistics are kept, the column arrays are released once computed
+    :return: The statistics, by column name
+    """
+
+    return {name: get_distribution(values) for name, values in get_bounty_columns().items()}
+
+
+def get_distribution(values: np.ndarray) -> dict:
+    """
+    Gets the distribution statistics of an array of amounts
+    :param values: The amounts
+    :return: The statistics: count, total, mean, quantiles, gini, top 1% share and histogram
+    """
+
+    count = len(values)
+    if count == 0:
+        return {"count": 0, "total": 0, "mean": 0.0, "quantiles": {q: 0 for q in QUANTILES}, "gini": 0.0,
+                "top_1_percent_share": 0.0, "histogram": {}}
+
+    sorted_values = np.sort(values)
+    # Negative amounts (debts) hold no share of the wealth
+    wealth = np.clip(sorted_values, 0, None).astype(np.float64)
+    total_wealth = wealth.sum()
+
+    gini = 0.0
+    top_1_percent_share = 0.0
+    if total_wealth > 0:
+        ranks = np.arange(1, count + 1, dtype=np.float64)
+        gini = float(2 * np.dot(ranks, wealth) / (count * total_wealth) - (count + 1) / count)
+        top_1_percent_share = float(wealth[-max(1, math.ceil(count * 0.01)):].sum() / total_wealth)
+
+    return {"count": count,
+            "total": int(sorted_values.sum()),
+            "mean": float(sorted_values.mean()),
+            "quantiles": {q: int(v) for q, v in zip(QUANTILES, np.quantile(sorted_values, QUANTILES,
+                                                                           method="lower"))},
+            "gini": gini,
+            "top_1_percent_share": top_1_percent_share,
+            "histogram": get_histogram(sorted_values)}
+
+
+def get_histogram(sorted_values: np.ndarray, max_amount: int = None) -> dict[str, int]:
+    """
+    Gets the histogram of sorted amounts, with order of magnitude buckets
+    :param sorted_values: The sorted amounts
+    :param max_amount: The amount the buckets should reach, so that histograms of different arrays can be compared.
+                       If None, the maximum of the amounts
+    :return: The number of values by bucket label
+    """
+
+    if max_amount is None:
+        max_amount = int(sorted_values[-1]) if len(sorted_values) > 0 else 0
+
+    # Buckets: below zero, zero to a thousand, then one per order of magnitude up to the maximum
+    max_exponent = max(3, math.ceil(math.log10(max(max_amount, 1) + 1)))
+    edges = [0] + [10 ** exponent for exponent in range(3, max_exponent + 1)]
+    counts = np.diff(np.searchsorted(sorted_values, edges, side="left"))
+
+    histogram = {"< 0": int(np.searchsorted(sorted_values, 0, side="left"))}
+    for lower, upper, bucket_count in zip(edges[:-1], edges[1:], counts):
+        histogram[f"{format_amount_short(lower)} - {format_amount_short(upper)}"] = int(bucket_count)
+    histogram[f"≥ {format_amount_short(edges[-1])}"] = int(len(sorted_values)
+                                                          - np.searchsorted(sorted_values, edges[-1], side="left"))
+
+    return histogram
+
+
+def format_amount_short(amount: int) -> str:
+    """
+    Formats an amount with a magnitude suffix
+    :param amount: The amount
+    :return: The formatted amount e.g. 10K, 1M, 100B
+    """
+
+    for divisor, suffix in [(10 ** 12, "T"), (10 ** 9, "B"), (10 ** 6, "M"), (10 ** 3, "K")]:
+        if amount >= divisor:
+            return f"{amount // divisor:,}{suffix}"
+
+    return str(amount)
@@ -0,0 +1,138 @@
+import datetime
+
+import streamlit as st
+from peewee import fn, Case, Expression, Select
+
+import resources.Environment as Env
+from src.model.BaseModel import db_obj
+from src.model.ImpelDownLog import ImpelDownLog
+from src.model.ImpelDownLogArchive import ImpelDownLogArchive
+from src.model.User import User
+from src.model.enums.impel_down.ImpelDownBountyAction import ImpelDownBountyAction
+from src.model.projection.UserListRow import UserListRow
+from src.model.statistics.ImpelDownDailySummary import ImpelDownDailySummary
+
+UNKNOWN_SOURCE = "Unknown"
+
+
+@st.cache_resource(show_spinner=False)
+def get_daily_summary() -> ImpelDownDailySummary:
+    """
+    Gets the daily summary shared by all sessions
+    :return: The daily summary
+    """
+
+    return ImpelDownDailySummary()
+
+
+def get_daily_statistics() -> list[dict]:
+    """
+    Gets the sentences and the bounty erased and halved by day and source.
+    Only the logs written since the last call are aggregated, with a single grouped query, and added to the summary.
+    Logs are aggregated by date once older than IMPEL_DOWN_STATISTICS_DELAY, instead of by id, since a transaction still
+    open when the summary is extended, e.g. a bulk sentence, can commit logs with lower ids later.
+    The archive, which only receives logs already older than any new one, is aggregated once when the summary is built
+    :return: The statistics by day and source, with day, source, sentences, erased and halved
+    """
+
+    summary = get_daily_summary()
+    with summary.lock:
+        if not summary.is_archive_aggregated:
+            add_daily_totals(summary, ImpelDownLogArchive, None)
+            summary.is_archive_aggregated = True
+
+        cutoff = datetime.datetime.now() - datetime.timedelta(seconds=Env.IMPEL_DOWN_STATISTICS_DELAY.get_int())
+        condition = ImpelDownLog.date_time < cutoff
+        if summary.watermark is not None:
+            condition &= (ImpelDownLog.date_time >= summary.watermark)
+        add_daily_totals(summary, ImpelDownLog, condition)
+        summary.watermark = cutoff
+
+        return [{"day": log_day, "source": source, "sentences": totals[0], "erased": totals[1], "halved": totals[2]}
+                for (log_day, source), totals in sorted(summary.rows.items())]
+
+
+def add_daily_totals(summary: ImpelDownDailySummary, log_model: type[ImpelDownLog | ImpelDownLogArchive],
+                     condition: Expression | None) -> None:
+    """
+    Adds the totals by day and source of the logs matching a condition to the summary
+    :param summary: The summary
+    :param log_model: ImpelDownLog or ImpelDownLogArchive
+    :param condition: The condition, None for all the logs
+    :return: None
+    """
+
+    day = fn.DATE(log_model.date_time)
+    lost_bounty = log_model.previous_bounty - log_model.new_bounty
+    query = (log_model
+             .select(day, log_model.source, fn.COUNT(log_model.sentence_type),
+                     fn.SUM(Case(log_model.bounty_action, [(ImpelDownBountyAction.ERASE, lost_bounty)], 0)),
+                     fn.SUM(Case(log_model.bounty_action, [(ImpelDownBountyAction.HALVE, lost_bounty)], 0)))
+             .group_by(day, log_model.source)
+             .tuples())
+    if condition is not None:
+        query = query.where(condition)
+
+    for log_day, source, sentences, erased, halved in query:
+        totals = summary.rows.setdefault((log_day, source or UNKNOWN_SOURCE), [0, 0, 0])
+        totals[0] += int(sentences)
+        totals[1] += int(erased or 0)
+        totals[2] += int(halved or 0)
+
+
+@st.cache_data(ttl=Env.STATISTICS_REFRESH_INTERVAL.get_int(), show_spinner=False)
+def get_reversal_and_bail_statistics() -> dict[str, int]:
+    """
+    Gets the reversal and bail totals with a single aggregate query per log table.
+    Logs can be reversed and bailed out after being written, so these are recomputed on a schedule
+    :return: The number of bounty actions, reversed bounty actions, bails and the total bail amount
+    """
+
+    statistics = {"bounty_actions": 0, "reversed": 0, "bails": 0, "bail_volume": 0}
+    for log_model in [ImpelDownLog, ImpelDownLogArchive]:
+        row = (log_model
+               .select(fn.COUNT(log_model.bounty_action),
+                       fn.SUM(Case(None, [((log_model.bounty_action.is_null(False)) & (log_model.is_reversed), 1)], 0)),
+                       fn.COUNT(log_model.bail_amount),
+                       fn.SUM(log_model.bail_amount))
+               .tuples()
+               .first())
+
+        for key, value in zip(statistics.keys(), row):
+            statistics[key] += int(value or 0)
+
+    return statistics
+
+
+@st.cache_data(ttl=Env.STATISTICS_REFRESH_INTERVAL.get_int(), show_spinner=False)
+def get_top_bail_payers(count: int) -> list[dict]:
+    """
+    Gets the users who paid the most bail with a single query, grouping the totals of each log table, aggregated on
+    its bail payer index, and keeping only the top users
+    :param count: The number of users
+    :return: The users, with display name, bails and amount
+    """
+
+    table_totals = [(log_model
+                     .select(log_model.bail_payer, fn.COUNT(log_model.id).alias("bails"),
+                             fn.SUM(log_model.bail_amount).alias("amount"))
+                     .where(log_model.bail_payer.is_null(False))
+                     .group_by(log_model.bail_payer))
+                    for log_model in [ImpelDownLog, ImpelDownLogArchive]]
+    bail_totals = table_totals[0].union_all(table_totals[1]).alias("bail_totals")
+
+    total_amount = fn.SUM(bail_totals.c.amount)
+    query = (Select([bail_totals], [bail_totals.c.bail_payer_id, fn.SUM(bail_totals.c.bails), total_amount])
+             .group_by(bail_totals.c.bail_payer_id)
+             .order_by(total_amount.desc())
+             .limit(count)
+             .tuples())
+    top_totals: list[tuple[int, tuple[int, int]]] = [(user_id, (int(bails), int(amount or 0)))
+                                                     for user_id, bails, amount in query.execute(db_obj.get_db())]
+    if len(top_totals) == 0:
+        return []
+
+    users = {user.id: user for user in UserListRow.from_query(
+        User.select().where(User.id.in_([user_id for user_id, _ in top_totals])))}
+    return [{"user": users[user_id].get_display_name(add_user_id=True) if user_id in users else str(user_id),
+             "bails": bails, "amount": amount} for user_id, (bails, amount) in top_totals]
@@ -1,24 +1,329 @@
+import datetime
+import operator
+from collections import defaultdict
+from functools import reduce
+from typing import Callable
+
+from peewee import ModelSelect, JOIN, Case, fn, Select, ModelCompoundSelectQuery
+from playhouse.mysql_ext import Match
+
+import resources.Environment as Env
+from src.model.BaseModel import db_obj
 from src.model.ImpelDownLog import ImpelDownLog
+from src.model.ImpelDownLogArchive import ImpelDownLogArchive
 from src.model.User import User
+from src.model.enums.impel_down.ImpelDownBountyAction import ImpelDownBountyAction
+from src.model.enums.impel_down.ImpelDownSentenceType import ImpelDownSentenceType
 from src.model.exceptions.ValidationException import ValidationException
+from src.model.projection.UserListRow import UserListRow
+from src.model.tgrest.TgRestImpelDownNotification import TgRestImpelDownNotification
+from src.service.db_service import get_full_text_phrase
+from src.service.tg_rest_service import send_tg_rest_batch
+
+
+def get_logs(log_model: type[ImpelDownLog | ImpelDownLogArchive] = ImpelDownLog) -> ModelSelect:
+    """
+    Gets all logs with their user and bail payer in a single query, loading only the list columns of both
+    :param log_model: ImpelDownLog for the recent logs, ImpelDownLogArchive for the archived ones
+    :return: Impel Down Logs
+    """
+
+    bail_payer = User.alias()
+    return (log_model
+            .select(log_model, *UserListRow.get_fields(), *UserListRow.get_fields(bail_payer))
+            .join(User, on=(log_model.user == User.id), attr="user")
+            .join_from(log_model, bail_payer, JOIN.LEFT_OUTER, on=(log_model.bail_payer == bail_payer.id),
+                       attr="bail_payer"))
+
+
+def filter_logs_by_date(query: ModelSelect, start_date: datetime.date, end_date: datetime.date) -> ModelSelect:
+    """
+    Filters logs by date, as a range on the date index
+    :param query: The logs query
+    :param start_date: The first date, included
+    :param end_date: The last date, included
+    :return: The filtered query
+    """
+
+    log_model: type[ImpelDownLog | ImpelDownLogArchive] = query.model
+    return query.where((log_model.date_time >= datetime.datetime.combine(start_date, datetime.time.min))
+                       & (log_model.date_time < datetime.datetime.combine(end_date + datetime.timedelta(days=1),
+                                                                          datetime.time.min)))
 
 
-def get_logs_by_string_filter(filter_by: str) -> list[ImpelDownLog]:
+def get_logs_by_string_filter(filter_by: str, log_model: type[ImpelDownLog | ImpelDownLogArchive] = ImpelDownLog
+                              ) -> ModelSelect:
     """
     Gets logs by string filter, searching by first name, last name, username, user id, reason, bounty action,
-    sentence type
+    sentence type.
+    Each criterion is answered by its own index: the user search for the user columns, the ngram full-text index for
+    the reason and exact matches for the bounty action and sentence type. Their ids are combined with a UNION, so
+    that only the matching logs are sorted
     :param filter_by: Filter by
+    :param log_model: ImpelDownLog for the recent logs, ImpelDownLogArchive for the archived ones
     :return: Impel Down Logs
     """
 
-    return ImpelDownLog.select().join(User).where((ImpelDownLog.user.tg_first_name.contains(filter_by)) |
-                                                  (ImpelDownLog.user.tg_last_name.contains(filter_by)) |
-                                                  (ImpelDownLog.user.tg_username.contains(filter_by)) |
-                                                  (ImpelDownLog.user.tg_user_id.contains(filter_by)) |
-                                                  (ImpelDownLog.reason.contains(filter_by)) |
-                                                  (ImpelDownLog.bounty_action.contains(filter_by)) |
-                                                  (ImpelDownLog.sentence_type.contains(filter_by))
-                                                  ).order_by(ImpelDownLog.id.desc()).limit(10)
+    filter_by = filter_by.strip()
+
+    matching_user_ids = User.get_string_filter_query(filter_by).select(User.id).order_by()
+    matching_queries = [
+        log_model.select(log_model.id).where(log_model.user.in_(matching_user_ids)),
+        log_model.select(log_model.id).where(
+            Match(log_model.reason, get_full_text_phrase(filter_by), modifier="IN BOOLEAN MODE"))]
+
+    # Bounty action and sentence type only have a few values, matched exactly
+    for enum_class, field in [(ImpelDownBountyAction, log_model.bounty_action),
+                              (ImpelDownSentenceType, log_model.sentence_type)]:
+        value = next((value for value in enum_class if value.lower() == filter_by.lower()), None)
+        if value is not None:
+            matching_queries.append(log_model.select(log_model.id).where(field == value))
+
+    matching_ids = reduce(operator.or_, matching_queries).alias("matching_logs")
+    return (get_logs(log_model)
+            .join(matching_ids, on=(log_model.id == matching_ids.c.id))
+            .order_by(log_model.id.desc()))
+
+
+def archive_logs(on_progress: Callable[[int], None] = None) -> int:
+    """
+    Moves the logs older than IMPEL_DOWN_LOG_ARCHIVE_AGE_DAYS to the archive table.
+    Logs are moved by chunks of IMPEL_DOWN_LOG_ARCHIVE_CHUNK_SIZE, each copied and deleted in its own short
+    transaction, so the log table is never locked for long
+    :param on_progress: Called after each chunk with the number of logs moved so far
+    :return: The number of archived logs
+    """
+
+    cutoff = datetime.datetime.now() - datetime.timedelta(days=Env.IMPEL_DOWN_LOG_ARCHIVE_AGE_DAYS.get_int())
+    chunk_size = Env.IMPEL_DOWN_LOG_ARCHIVE_CHUNK_SIZE.get_int()
+    fields = [getattr(ImpelDownLogArchive, field.name) for field in ImpelDownLog._meta.sorted_fields]
+
+    archived_count = 0
+    while True:
+        with db_obj.get_db().atomic():
+            # Oldest logs first, read on the date index
+            log_ids = [log_id for (log_id,) in (ImpelDownLog
+                                                .select(ImpelDownLog.id)
+                                                .where(ImpelDownLog.date_time < cutoff)
+                                                .order_by(ImpelDownLog.date_time, ImpelDownLog.id)
+                                                .limit(chunk_size)
+                                                .for_update()
+                                                .tuples())]
+            if len(log_ids) == 0:
+                break
+
+            (ImpelDownLogArchive
+             .insert_from(ImpelDownLog.select(*ImpelDownLog._meta.sorted_fields).where(ImpelDownLog.id.in_(log_ids)),
+                          fields)
+             .execute())
+            ImpelDownLog.delete().where(ImpelDownLog.id.in_(log_ids)).execute()
+
+        archived_count += len(log_ids)
+        if on_progress is not None:
+            on_progress(archived_count)
+
+        if len(log_ids) < chunk_size:
+            break
+
+    return archived_count
+
+
+def get_temporarily_imprisoned_users() -> ModelSelect:
+    """
+    Gets the users with a temporary sentence still running, as a range on the release date index.
+    Only the list columns are loaded
+    :return: The users query
+    """
+
+    return (User.select(*UserListRow.get_fields())
+            .where((User.impel_down_release_date > datetime.datetime.now())
+                   & (User.impel_down_is_permanent == False)))
+
+
+def get_permanently_imprisoned_users() -> ModelSelect:
+    """
+    Gets the users with a permanent sentence, as a lookup on the is permanent index.
+    Only the list columns are loaded
+    :return: The users query
+    """
+
+    return User.select(*UserListRow.get_fields()).where(User.impel_down_is_permanent == True)
+
+
+def sentence_users(user_ids: list[int], sentence_type: ImpelDownSentenceType,
+                   release_date_time: datetime.datetime | None, bounty_action: ImpelDownBountyAction, reason: str
+                   ) -> dict[int, int]:
+    """
+    Sentences many users at once in a single transaction: the users are locked, updated with one statement and their
+    logs are inserted with another
+    :param user_ids: The user ids
+    :param sentence_type: The sentence type
+    :param release_date_time: The release date time, for temporary sentences
+    :param bounty_action: The bounty action
+    :param reason: The reason
+    :return: The id of the log of each sentenced user, by user id
+    """
+
+    if len(user_ids) == 0:
+        return {}
+
+    is_permanent = sentence_type is ImpelDownSentenceType.PERMANENT
+    if sentence_type is not ImpelDownSentenceType.TEMPORARY:
+        release_date_time = None
+
+    user_update = {User.impel_down_is_permanent: is_permanent, User.impel_down_release_date: release_date_time}
+    if bounty_action is ImpelDownBountyAction.HALVE:
+        user_update[User.bounty] = fn.FLOOR(User.bounty / 2)
+    elif bounty_action is ImpelDownBountyAction.ERASE:
+        user_update[User.bounty] = 0
+
+    date_time = datetime.datetime.now().replace(microsecond=0)
+    with db_obj.get_db().atomic():
+        previous_bounties: dict[int, int] = {user_id: bounty for user_id, bounty in (
+            User.select(User.id, User.bounty).where(User.id.in_(user_ids)).for_update().tuples())}
+        if len(previous_bounties) == 0:
+            return {}
+
+        User.update(user_update).where(User.id.in_(list(previous_bounties.keys()))).execute()
+
+        ImpelDownLog.insert_many([{
+            ImpelDownLog.user: user_id,
+            ImpelDownLog.sentence_type: sentence_type if sentence_type is not ImpelDownSentenceType.NONE else None,
+            ImpelDownLog.date_time: date_time,
+            ImpelDownLog.release_date_time: release_date_time,
+            ImpelDownLog.is_permanent: is_permanent,
+            ImpelDownLog.bounty_action: bounty_action if bounty_action is not ImpelDownBountyAction.NONE else None,
+            ImpelDownLog.reason: reason if len(reason) > 0 else None,
+            ImpelDownLog.previous_bounty: previous_bounty,
+            ImpelDownLog.new_bounty: get_new_bounty(previous_bounty, bounty_action)
+        } for user_id, previous_bounty in previous_bounties.items()]).execute()
+
+        # Ids of a multi-row insert are not guaranteed to be consecutive, read them back on the user date index
+        return {user_id: log_id for user_id, log_id in (
+            ImpelDownLog.select(ImpelDownLog.user, fn.MAX(ImpelDownLog.id))
+            .where((ImpelDownLog.user.in_(list(previous_bounties.keys()))) & (ImpelDownLog.date_time == date_time))
+            .group_by(ImpelDownLog.user)
+            .tuples())}
+
+
+def notify_sentenced_users(log_ids: dict[int, int], sentence_type: ImpelDownSentenceType,
+                           release_date_time: datetime.datetime | None, bounty_action: ImpelDownBountyAction,
+                           reason: str, on_progress: Callable[[int, int], None] = None) -> list[int]:
+    """
+    Sends the notification of a bulk sentence to each user concurrently and flags the logs whose message was sent
+    :param log_ids: The id of the log of each sentenced user, by user id
+    :param sentence_type: The sentence type
+    :param release_date_time: The release date time, for temporary sentences
+    :param bounty_action: The bounty action
+    :param reason: The reason
+    :param on_progress: Called after each notification with the number of sent and total notifications
+    :return: The ids of the users whose notification was not sent
+    """
+
+    if sentence_type is not ImpelDownSentenceType.TEMPORARY:
+        release_date_time = None
+
+    user_ids = list(log_ids.keys())
+    notifications = [TgRestImpelDownNotification(user_id, sentence_type, release_date_time, bounty_action, reason)
+                     for user_id in user_ids]
+    results = send_tg_rest_batch(notifications, on_progress=on_progress)
+
+    set_messages_sent([log_ids[user_id] for user_id, is_sent in zip(user_ids, results) if is_sent])
+
+    return [user_id for user_id, is_sent in zip(user_ids, results) if not is_sent]
+
+
+def get_amnesty_candidates(only_temporary: bool, sentenced_before: datetime.date = None, source: str = None
+                           ) -> ModelSelect:
+    """
+    Gets the imprisoned users eligible for an amnesty, read on the release date and is permanent indexes
+    :param only_temporary: Only the users with a temporary sentence
+    :param sentenced_before: If not None, only the users whose current sentence is before this date
+    :param source: If not None, only the users whose current sentence is from this source
+    :return: The users query
+    """
+
+    imprisoned_condition = ((User.impel_down_release_date > datetime.datetime.now())
+                            & (User.impel_down_is_permanent == False))
+    if not only_temporary:
+        imprisoned_condition |= (User.impel_down_is_permanent == True)
+
+    query = User.select(*UserListRow.get_fields()).where(imprisoned_condition)
+
+    if sentenced_before is not None or source is not None:
+        # Only the current sentence of each user, its latest sentence log in either table (ids are shared)
+        latest_sentences = get_sentence_logs("latest_sentence")
+        latest_sentence_ids = (Select([latest_sentences], [fn.MAX(latest_sentences.c.id)])
+                               .group_by(latest_sentences.c.user_id))
+
+        current_sentences = get_sentence_logs("current_sentence")
+        sentenced_user_ids = (Select([current_sentences], [current_sentences.c.user_id])
+                              .where(current_sentences.c.id.in_(latest_sentence_ids)))
+        if sentenced_before is not None:
+            sentenced_user_ids = sentenced_user_ids.where(
+                current_sentences.c.date_time < datetime.datetime.combine(sentenced_before, datetime.time.min))
+        if source is not None:
+            sentenced_user_ids = sentenced_user_ids.where(current_sentences.c.source == source)
+
+        query = query.where(User.id.in_(sentenced_user_ids))
+
+    return query
+
+
+def get_sentence_logs(alias: str) -> ModelCompoundSelectQuery:
+    """
+    Gets the user, id, date and source of the sentence logs of both the recent and the archived logs
+    :param alias: The alias of the derived table
+    :return: The sentence logs derived table
+    """
+
+    queries = [log_model.select(log_model.user, log_model.id, log_model.date_time, log_model.source)
+               .where(log_model.sentence_type.is_null(False))
+               for log_model in [ImpelDownLog, ImpelDownLogArchive]]
+
+    return queries[0].union_all(queries[1]).alias(alias)
+
+
+def get_sources() -> list[str]:
+    """
+    Gets the distinct sources of the logs
+    :return: The sources
+    """
+
+    return [source for (source,) in (ImpelDownLog
+                                     .select(ImpelDownLog.source)
+                                     .where(ImpelDownLog.source.is_null(False))
+                                     .distinct()
+                                     .order_by(ImpelDownLog.source)
+                                     .tuples())]
+
+
+def get_new_bounty(bounty: int, bounty_action: ImpelDownBountyAction) -> int:
+    """
+    Gets the bounty after a bounty action, with the same rule applied by the database
+    :param bounty: The bounty
+    :param bounty_action: The bounty action
+    :return: The new bounty
+    """
+
+    if bounty_action is ImpelDownBountyAction.HALVE:
+        return bounty // 2
+
+    if bounty_action is ImpelDownBountyAction.ERASE:
+        return 0
+
+    return bounty
+
+
+def set_messages_sent(log_ids: list[int]) -> None:
+    """
+    Flags the logs whose notification was sent
+    :param log_ids: The log ids
+    :return: None
+    """
+
+    if len(log_ids) > 0:
+        ImpelDownLog.update(message_sent=True).where(ImpelDownLog.id.in_(log_ids)).execute()
 
 
 def get_log_display_text(log: ImpelDownLog) -> str:
@@ -37,7 +342,9 @@ def get_log_display_text(log: ImpelDownLog) -> str:
 
 def reverse_bounty_action(log: ImpelDownLog) -> None:
     """
-    Reverses the bounty action
+    Reverses the bounty action, giving the lost bounty back to the user.
+    The log is flagged only if not reversed yet and the bounty is incremented by the database in the same
+    transaction, so neither a concurrent reversal nor a bounty change made by the bot in between is lost
     :param log: Impel Down Log
     :return: None
     """
@@ -45,14 +352,55 @@ def reverse_bounty_action(log: ImpelDownLog) -> None:
     if log.is_reversed:
         raise ValidationException("Bounty action already reversed")
 
-    user: User = log.user
-
-    # Add lost bounty back
-    user.bounty += (log.previous_bounty - log.new_bounty)
+    with db_obj.get_db().atomic():
+        updated_count = (ImpelDownLog
+                         .update(is_reversed=True)
+                         .where((ImpelDownLog.id == log.id) & (ImpelDownLog.is_reversed == False))
+                         .execute())
+        if updated_count == 0:
+            raise ValidationException("Bounty action already reversed")
 
-    # Update user
-    user.save()
+        # Add lost bounty back
+        User.update(bounty=User.bounty + (log.previous_bounty - log.new_bounty)).where(User.id == log.user_id).execute()
 
-    # Update log
     log.is_reversed = True
-    log.save()
+
+
+def reverse_bounty_actions(log_ids: list[int]) -> int:
+    """
+    Reverses the bounty actions of a set of logs in a single transaction: the logs with a bounty action not reversed yet
+    are locked, flagged with one statement and the lost bounty of each user is given back with another, whatever the
+    number of logs
+    :param log_ids: The ids of the logs
+    :return: The number of reversed logs
+    """
+
+    if len(log_ids) == 0:
+        return 0
+
+    with db_obj.get_db().atomic():
+        logs = list(ImpelDownLog
+                    .select(ImpelDownLog.id, ImpelDownLog.user, ImpelDownLog.previous_bounty, ImpelDownLog.new_bounty)
+                    .where((ImpelDownLog.id.in_(log_ids))
+                           & (ImpelDownLog.is_reversed == False)
+                           & (ImpelDownLog.bounty_action.is_null(False))
+                           & (ImpelDownLog.previous_bounty.is_null(False))
+                           & (ImpelDownLog.new_bounty.is_null(False)))
+                    .for_update()
+                    .tuples())
+        if len(logs) == 0:
+            return 0
+
+        ImpelDownLog.update(is_reversed=True).where(ImpelDownLog.id.in_([log[0] for log in logs])).execute()
+
+        # Lost bounty by user, a user can have more than one log
+        deltas: dict[int, int] = defaultdict(int)
+        for _, user_id, previous_bounty, new_bounty in logs:
+            deltas[user_id] += previous_bounty - new_bounty
+
+        (User
+         .update(bounty=User.bounty + Case(User.id, list(deltas.items()), 0))
+         .where(User.id.in_(list(deltas.keys())))
+         .execute())
+
+    return len(logs)
@@ -0,0 +1,59 @@
+import numpy as np
+import streamlit as st
+
+import resources.Environment as Env
+from src.model.User import User
+from src.model.projection.UserListRow import UserListRow
+from src.service.db_service import stream_tuples
+
+
+def get_top_users(count: int, crew_id: int = None) -> list[UserListRow]:
+    """
+    Gets the users with the highest bounty, read from the bounty index
+    :param count: The number of users
+    :param crew_id: If not None, only the members of this crew
+    :return: The users, by bounty descending
+    """
+
+    query = UserListRow.from_query(User.select())
+    if crew_id is not None:
+        query = query.where(User.crew == crew_id)
+
+    return list(query.order_by(User.bounty.desc()).limit(count))
+
+
+@st.cache_resource(ttl=Env.LEADERBOARD_REFRESH_INTERVAL.get_int(), show_spinner=False)
+def get_sorted_bounties(crew_id: int = None) -> np.ndarray:
+    """
+    Gets the bounties of all users sorted ascending, shared by all sessions and recomputed on a schedule
+    :param crew_id: If not None, only the members of this crew
+    :return: The sorted bounties
+    """
+
+    query = User.select(User.bounty)
+    if crew_id is not None:
+        query = query.where(User.crew == crew_id)
+
+    bounties = np.concatenate([np.array(rows, dtype=np.int64).reshape(-1) for rows in stream_tuples(query)]
+                              or [np.empty(0, dtype=np.int64)])
+    bounties.sort()
+    bounties.flags.writeable = False
+
+    return bounties
+
+
+def get_rank(bounty: int, sorted_bounties: np.ndarray) -> tuple[int, float]:
+    """
+    Gets the rank of a bounty by binary search, users with the same bounty share the same rank
+    :param bounty: The bounty
+    :param sorted_bounties: The sorted bounties
+    :return: The rank, starting from 1, and the percentage of users with a lower bounty
+    """
+
+    if len(sorted_bounties) == 0:
+        return 1, 0.0
+
+    rank = len(sorted_bounties) - int(np.searchsorted(sorted_bounties, bounty, side='right')) + 1
+    percentile = int(np.searchsorted(sorted_bounties, bounty, side='left')) / len(sorted_bounties) * 100
+
+    return rank, percentile
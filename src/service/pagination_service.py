@@ -0,0 +1,86 @@
+from peewee import Field, ModelSelect, Expression
+
+import resources.Environment as Env
+from src.model.enums.PageDirection import PageDirection
+from src.model.pagination.KeysetPage import KeysetPage
+
+
+def get_page(query: ModelSelect, sort_field: Field, cursor: tuple[PageDirection, any, int] = None,
+             page_size: int = None, ascending: bool = False) -> KeysetPage:
+    """
+    Gets a page of the query with keyset pagination on the sort field, using the primary key as tiebreaker.
+    Pages seek past the cursor on the (sort field, id) index instead of using an OFFSET, so fetching a page costs the
+    same at any depth
+    :param query: The query, any order and limit are replaced
+    :param sort_field: The sort field, should be indexed together with the primary key
+    :param cursor: The cursor of the page to get, None for the first page
+    :param page_size: The page size. If None, MAX_ITEMS_DISPLAYED_LIST is used
+    :param ascending: If the items should be sorted in ascending order
+    :return: The page
+    """
+
+    id_field: Field = sort_field.model._meta.primary_key
+    page_size = page_size if page_size is not None else Env.MAX_ITEMS_DISPLAYED_LIST.get_int()
+
+    is_forward = cursor is None or cursor[0] == PageDirection.NEXT
+    # Going back, the rows before the cursor are read in reverse order and the page is flipped afterwards
+    seek_ascending = ascending if is_forward else not ascending
+
+    if cursor is not None:
+        query = query.where(get_seek_condition(sort_field, id_field, cursor[1], cursor[2], seek_ascending))
+
+    if seek_ascending:
+        query = query.order_by(sort_field.asc(), id_field.asc())
+    else:
+        query = query.order_by(sort_field.desc(), id_field.desc())
+
+    # Fetch one more item to know if there is another page in the same direction
+    items: list = list(query.limit(page_size + 1))
+    has_more = len(items) > page_size
+    items = items[:page_size]
+
+    if is_forward:
+        has_previous, has_next = cursor is not None, has_more
+    else:
+        items.reverse()
+        has_previous, has_next = has_more, True
+
+    if len(items) == 0:
+        return KeysetPage(items, None, None)
+
+    previous_cursor = get_cursor(PageDirection.PREVIOUS, items[0], sort_field, id_field) if has_previous else None
+    next_cursor = get_cursor(PageDirection.NEXT, items[-1], sort_field, id_field) if has_next else None
+
+    return KeysetPage(items, previous_cursor, next_cursor)
+
+
+def get_seek_condition(sort_field: Field, id_field: Field, sort_value: any, id_value: int, ascending: bool
+                       ) -> Expression:
+    """
+    Gets the condition selecting the rows after the (sort value, id) key in the given order
+    :param sort_field: The sort field
+    :param id_field: The primary key field
+    :param sort_value: The sort value of the key
+    :param id_value: The id of the key
+    :param ascending: If the order is ascending
+    :return: The condition
+    """
+
+    if ascending:
+        return (sort_field > sort_value) | ((sort_field == sort_value) & (id_field > id_value))
+
+    return (sort_field < sort_value) | ((sort_field == sort_value) & (id_field < id_value))
+
+
+def get_cursor(direction: PageDirection, item: any, sort_field: Field, id_field: Field
+               ) -> tuple[PageDirection, any, int]:
+    """
+    Gets the cursor pointing to an item
+    :param direction: The direction of the cursor
+    :param item: The item
+    :param sort_field: The sort field
+    :param id_field: The primary key field
+    :return: The cursor
+    """
+
+    return direction, getattr(item, sort_field.name), getattr(item, id_field.name)
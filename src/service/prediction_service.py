@@ -0,0 +1,285 @@
+import csv
+import io
+import json
+from datetime import datetime
+
+from peewee import Case, chunked, fn, SQL, Column
+
+import constants as c
+import resources.Environment as Env
+from src.model.BaseModel import db_obj
+from src.model.Prediction import Prediction
+from src.model.PredictionOption import PredictionOption
+from src.model.enums.PredictionStatus import PredictionStatus
+from src.model.enums.PredictionType import PredictionType
+from src.model.exceptions.ValidationException import ValidationException
+
+# Accepted boolean values of an import record, lowercase
+RECORD_TRUE_VALUES = ["true", "yes", "y", "1"]
+RECORD_FALSE_VALUES = ["false", "no", "n", "0"]
+
+
+def get_options_by_prediction(predictions: list[Prediction]) -> dict[int, list[PredictionOption]]:
+    """
+    Gets the options of a list of predictions with a single query, instead of one query per prediction backref access
+    :param predictions: The predictions
+    :return: The options of each prediction sorted by number, by prediction id
+    """
+
+    options: dict[int, list[PredictionOption]] = {prediction.id: [] for prediction in predictions}
+    if len(options) == 0:
+        return options
+
+    for prediction_option in (PredictionOption
+                              .select()
+                              .where(PredictionOption.prediction.in_(list(options.keys())))
+                              .order_by(PredictionOption.prediction, PredictionOption.number, PredictionOption.id)):
+        options[prediction_option.prediction_id].append(prediction_option)
+
+    return options
+
+
+def save_prediction(prediction: Prediction, options: list[str], prediction_options: list[PredictionOption] = None
+                    ) -> None:
+    """
+    Saves a prediction and its options in a single transaction.
+    Options are matched by number with the stored ones, so only the changed ones are updated, with one statement, the
+    new ones are inserted with one statement and the removed ones deleted with another. Unchanged options keep their id
+    :param prediction: The prediction
+    :param options: The option texts, in order. Empty options are skipped but keep their number
+    :param prediction_options: The stored options, None for a new prediction
+    :return: None
+    """
+
+    form_options: dict[int, str] = {number: option for number, option in enumerate(options, start=1)
+                                    if str(option).strip() != ""}
+    stored_options: dict[int, PredictionOption] = {o.number: o for o in (prediction_options or [])}
+
+    changed_options: list[tuple[int, str]] = [(stored_options[number].id, option)
+                                              for number, option in form_options.items()
+                                              if number in stored_options and stored_options[number].option != option]
+    removed_option_ids: list[int] = [o.id for number, o in stored_options.items() if number not in form_options]
+
+    with db_obj.get_db().atomic():
+        prediction.save()
+
+        if len(changed_options) > 0:
+            (PredictionOption
+             .update(option=Case(PredictionOption.id, changed_options))
+             .where(PredictionOption.id.in_([option_id for option_id, _ in changed_options]))
+             .execute())
+
+        added_options = [{PredictionOption.prediction: prediction.id, PredictionOption.number: number,
+                          PredictionOption.option: option}
+                         for number, option in form_options.items() if number not in stored_options]
+        if len(added_options) > 0:
+            PredictionOption.insert_many(added_options).execute()
+
+        if len(removed_option_ids) > 0:
+            PredictionOption.delete().where(PredictionOption.id.in_(removed_option_ids)).execute()
+
+
+def set_correct_options(prediction: Prediction, correct_option_ids: list[int]) -> bool:
+    """
+    Sets the correct options of a prediction with a single statement, flagging the given options and clearing all the
+    others, so setting the same results twice leaves the options unchanged.
+    The prediction is locked and the request of the results is recorded in the same transaction, since the status is
+    only changed by the bot once it receives the command, so a second request before then is refused too
+    :param prediction: The prediction
+    :param correct_option_ids: The ids of the correct options, empty if no option is correct
+    :return: False if the results of the prediction had already been set or requested, True otherwise
+    """
+
+    # Not a model field, so that saving a prediction loaded before the request never clears it
+    results_requested_date = Column(Prediction._meta.table, "results_requested_date")
+    with db_obj.get_db().atomic():
+        status, requested_date = (Prediction
+                                  .select(Prediction.status, results_requested_date)
+                                  .where(Prediction.id == prediction.id)
+                                  .for_update()
+                                  .tuples()
+                                  .first())
+        if PredictionStatus(status) >= PredictionStatus.RESULT_SET or requested_date is not None:
+            return False
+
+        (PredictionOption
+         .update(is_correct=PredictionOption.id.in_(correct_option_ids))
+         .where(PredictionOption.prediction == prediction.id)
+         .execute())
+
+        (Prediction
+         .update({results_requested_date: datetime.now()})
+         .where(Prediction.id == prediction.id)
+         .execute())
+
+    return True
+
+
+def parse_prediction_records(file_name: str, content: bytes) -> list[dict]:
+    """
+    Parses the records of a prediction import file, encoded in UTF-8 with or without BOM.
+    A JSON file holds a list of objects, a CSV file has a header row with the same field names
+    :param file_name: The file name, its extension tells the format
+    :param content: The file content
+    :return: The records, in file order
+    """
+
+    try:
+        text = content.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise ValidationException("The file must be encoded in UTF-8")
+
+    if file_name.lower().endswith(".json"):
+        try:
+            records = json.loads(text)
+        except ValueError as e:
+            raise ValidationException(f"Invalid JSON: {e}")
+
+        if not isinstance(records, list) or not all(isinstance(record, dict) for record in records):
+            raise ValidationException("The JSON file must contain a list of objects")
+
+        return records
+
+    try:
+        return list(csv.DictReader(io.StringIO(text)))
+    except csv.Error as e:
+        raise ValidationException(f"Invalid CSV: {e}")
+
+
+def get_prediction_from_record(record: dict) -> tuple[Prediction, list[str]]:
+    """
+    Gets a new prediction and its option texts from an import record, without validating the values.
+    Options are a list in JSON and separated by the standard split char in CSV; missing flags take the defaults of the
+    add form. Raises an exception if a value has a wrong format
+    :param record: The record
+    :return: The unsaved prediction and its option texts
+    """
+
+    prediction: Prediction = Prediction()
+    prediction.question = str(record.get("question") or "").strip()
+
+    prediction_type = record.get("type") or PredictionType.VERSUS.value
+    if prediction_type not in [p.value for p in PredictionType]:
+        raise ValidationException(f"Invalid type: {prediction_type}")
+    prediction.type = prediction_type
+
+    options = record.get("options") or []
+    if isinstance(options, str):
+        options = options.split(c.STANDARD_SPLIT_CHAR)
+    elif not isinstance(options, list):
+        raise ValidationException("Options must be a list or a text separated by " + c.STANDARD_SPLIT_CHAR)
+    options = [str(option).strip() for option in options]
+    if not 2 <= len(options) <= 10:
+        raise ValidationException("A prediction must have from 2 to 10 options")
+
+    prediction.send_date = get_record_datetime(record, "send_date")
+    prediction.end_date = get_record_datetime(record, "end_date")
+
+    prediction.refund_wager = get_record_bool(record, "refund_wager", Env.REFUND_WAGER_DEFAULT.get_bool())
+    if prediction.refund_wager:
+        prediction.max_refund_wager = Env.PREDICTION_BET_MAX_REFUNDABLE_WAGER.get_int()
+    prediction.allow_multiple_choices = get_record_bool(record, "allow_multiple_choices",
+                                                        Env.ALLOW_MULTIPLE_CHOICES_DEFAULT.get_bool())
+    prediction.can_withdraw_bet = get_record_bool(record, "can_withdraw_bet", Env.CAN_WITHDRAW_BET_DEFAULT.get_bool())
+
+    return prediction, options
+
+
+def get_record_datetime(record: dict, field: str) -> datetime | None:
+    """
+    Gets an ISO date and time of an import record, e.g. 2024-01-31 11:00
+    :param record: The record
+    :param field: The field name
+    :return: The date and time, None if missing
+    """
+
+    value = record.get(field)
+    if value is None or str(value).strip() == "":
+        return None
+
+    try:
+        return datetime.fromisoformat(str(value).strip())
+    except ValueError:
+        raise ValidationException(f"Invalid {field}: {value}")
+
+
+def get_record_bool(record: dict, field: str, default_value: bool) -> bool:
+    """
+    Gets a boolean of an import record
+    :param record: The record
+    :param field: The field name
+    :param default_value: The value if missing
+    :return: The boolean
+    """
+
+    value = record.get(field)
+    if value is None or str(value).strip() == "":
+        return default_value
+
+    if isinstance(value, bool):
+        return value
+
+    text = str(value).strip().lower()
+    if text in RECORD_TRUE_VALUES:
+        return True
+    if text in RECORD_FALSE_VALUES:
+        return False
+
+    raise ValidationException(f"Invalid {field}: {value}")
+
+
+def get_existing_questions(questions: list[str]) -> set[str]:
+    """
+    Gets which questions already have a prediction, ignoring case and surrounding spaces, with batched lookups on the
+    question hash index instead of one query per question
+    :param questions: The questions
+    :return: The existing questions, trimmed and lowercase
+    """
+
+    existing_questions: set[str] = set()
+    for chunk in chunked(questions, Env.PREDICTION_IMPORT_CHUNK_SIZE.get_int()):
+        existing_questions.update(question for (question,) in (
+            Prediction
+            .select(fn.LOWER(fn.TRIM(Prediction.question)))
+            .where(SQL("question_hash").in_([Prediction.get_question_hash(question) for question in chunk]))
+            .tuples()))
+
+    return existing_questions
+
+
+def import_predictions(predictions: list[tuple[Prediction, list[str]]]) -> int:
+    """
+    Inserts new predictions and their options in a single transaction, with batched multi-row inserts instead of one
+    statement per row. The ids of the predictions are read back by their unique question
+    :param predictions: The unsaved predictions with their option texts
+    :return: The number of imported predictions
+    """
+
+    if len(predictions) == 0:
+        return 0
+
+    chunk_size = Env.PREDICTION_IMPORT_CHUNK_SIZE.get_int()
+    fields = [Prediction.type, Prediction.question, Prediction.send_date, Prediction.end_date, Prediction.refund_wager,
+              Prediction.max_refund_wager, Prediction.allow_multiple_choices, Prediction.can_withdraw_bet]
+    rows = [tuple(getattr(prediction, field.name) for field in fields) for prediction, _ in predictions]
+
+    with db_obj.get_db().atomic():
+        for chunk in chunked(rows, chunk_size):
+            Prediction.insert_many(chunk, fields=fields).execute()
+
+        questions = [prediction.question for prediction, _ in predictions]
+        ids_by_question: dict[str, int] = {}
+        for chunk in chunked(questions, chunk_size):
+            ids_by_question.update({question: prediction_id for prediction_id, question in
+                                    Prediction.select(Prediction.id, Prediction.question)
+                                    .where(Prediction.question.in_(chunk))
+                                    .tuples()})
+
+        option_rows = [(ids_by_question[prediction.question], number, option)
+                       for prediction, options in predictions
+                       for number, option in enumerate(options, start=1)]
+        for chunk in chunked(option_rows, chunk_size):
+            PredictionOption.insert_many(chunk, fields=[PredictionOption.prediction, PredictionOption.number,
+                                                        PredictionOption.option]).execute()
+
+    return len(predictions)
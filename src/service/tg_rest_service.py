@@ -1,7 +1,11 @@
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable
 
+import requests
 import streamlit as st
 
+import resources.Environment as Env
 from src.model.User import User
 from src.model.tgrest.TgBot import TgBot
 from src.model.tgrest.TgBot import TgBotRequestException
@@ -42,6 +46,36 @@ def send_tg_rest(tg_rest: TgRest, success_message: str = None) -> None:
         return
 
 
+def send_tg_rest_batch(tg_rests: list[TgRest], on_progress: Callable[[int, int], None] = None) -> list[bool]:
+    """
+    Send many tg rest commands concurrently, with BULK_NOTIFICATION_WORKERS requests at the same time.
+    Errors are not shown, the caller reports them from the result
+    :param tg_rests: TgRest list
+    :param on_progress: Called after each command with the number of sent and total commands
+    :return: If each command was sent, in the same order
+    """
+
+    results: list[bool] = [False] * len(tg_rests)
+    if len(tg_rests) == 0:
+        return results
+
+    tg_bot = TgBot()
+    with ThreadPoolExecutor(max_workers=Env.BULK_NOTIFICATION_WORKERS.get_int()) as executor:
+        futures = {executor.submit(tg_bot.send_message, tg_rest): index for index, tg_rest in enumerate(tg_rests)}
+        for completed_count, future in enumerate(as_completed(futures), start=1):
+            try:
+                future.result()
+                results[futures[future]] = True
+            except (TgBotRequestException, requests.RequestException):
+                # Left as not sent, so that it is reported and the rest of the batch goes on
+                pass
+
+            if on_progress is not None:
+                on_progress(completed_count, len(tg_rests))
+
+    return results
+
+
 def escape_valid_markdown_chars(text: str) -> str:
     """
     Escape valid markdown chars
@@ -0,0 +1,142 @@
+import datetime
+import heapq
+from itertools import islice
+from typing import Callable, Iterator
+
+from peewee import Field, ModelSelect
+
+from src.model.DevilFruit import DevilFruit
+from src.model.ImpelDownLog import ImpelDownLog
+from src.model.ImpelDownLogArchive import ImpelDownLogArchive
+from src.model.Warlord import Warlord
+from src.model.timeline.TimelineEvent import TimelineEvent
+from src.service.pagination_service import get_seek_condition
+
+SOURCE_IMPEL_DOWN = "Impel Down"
+SOURCE_WARLORD = "Warlord"
+SOURCE_DEVIL_FRUIT = "Devil Fruit"
+
+
+def get_timeline(user_id: int, count: int) -> list[TimelineEvent]:
+    """
+    Gets the latest events of a user, from the most recent.
+    Each source is read lazily in time order on its (user, date, id) index and the sources are merged as they are
+    consumed, so only about count rows are read from each of them
+    :param user_id: The user id
+    :param count: The number of events
+    :return: The events
+    """
+
+    now = datetime.datetime.now()
+    streams = [
+        stream_events(ImpelDownLog.select().where(ImpelDownLog.user == user_id), ImpelDownLog.date_time,
+                      get_impel_down_event, count),
+        stream_events(ImpelDownLogArchive.select().where(ImpelDownLogArchive.user == user_id),
+                      ImpelDownLogArchive.date_time, get_impel_down_event, count),
+        stream_events(Warlord.select().where(Warlord.user == user_id), Warlord.date, get_warlord_appointment_event,
+                      count),
+        stream_events(Warlord.select().where((Warlord.user == user_id) & (Warlord.end_date <= now)),
+                      Warlord.end_date, get_warlord_end_event, count),
+        stream_events(DevilFruit.select().where((DevilFruit.owner == user_id)
+                                                & (DevilFruit.collection_date.is_null(False))),
+                      DevilFruit.collection_date, get_devil_fruit_collection_event, count),
+        stream_events(DevilFruit.select().where((DevilFruit.owner == user_id)
+                                                & (DevilFruit.eaten_date.is_null(False))),
+                      DevilFruit.eaten_date, get_devil_fruit_eaten_event, count)
+    ]
+
+    return list(islice(heapq.merge(*streams, key=lambda event: event.date_time, reverse=True), count))
+
+
+def stream_events(query: ModelSelect, date_field: Field, get_event: Callable[[any], TimelineEvent], chunk_size: int
+                  ) -> Iterator[TimelineEvent]:
+    """
+    Streams the events of a source from the most recent, reading the query in keyset chunks on (date, id)
+    :param query: The source query
+    :param date_field: The date field of the events
+    :param get_event: Function creating the event of a record
+    :param chunk_size: The number of records read per query
+    :return: The events
+    """
+
+    id_field: Field = query.model._meta.primary_key
+    chunk_query = query
+    while True:
+        records = list(chunk_query.order_by(date_field.desc(), id_field.desc()).limit(chunk_size))
+        for record in records:
+            yield get_event(record)
+
+        if len(records) < chunk_size:
+            return
+
+        last_record = records[-1]
+        chunk_query = query.where(get_seek_condition(date_field, id_field, getattr(last_record, date_field.name),
+                                                     last_record.id, ascending=False))
+
+
+def get_impel_down_event(log: ImpelDownLog | ImpelDownLogArchive) -> TimelineEvent:
+    """
+    Gets the event of an Impel Down log, recent or archived
+    :param log: The log
+    :return: The event
+    """
+
+    actions = [action for action in [log.sentence_type, log.bounty_action] if action is not None]
+    title = "Impel Down: " + (", ".join(actions) if len(actions) > 0 else "sentence")
+    if log.is_reversed:
+        title += " (reversed)"
+
+    details = []
+    if log.reason is not None:
+        details.append(log.reason)
+    if log.previous_bounty is not None and log.new_bounty is not None:
+        details.append("Bounty {0:,} → {1:,}".format(log.previous_bounty, log.new_bounty))
+
+    return TimelineEvent(log.date_time, SOURCE_IMPEL_DOWN, log.id, title, " · ".join(details) or None)
+
+
+def get_warlord_appointment_event(warlord: Warlord) -> TimelineEvent:
+    """
+    Gets the appointment event of a Warlord term
+    :param warlord: The Warlord
+    :return: The event
+    """
+
+    title = "Appointed Warlord" + (f" as {warlord.epithet}" if warlord.epithet is not None else "")
+    return TimelineEvent(warlord.date, SOURCE_WARLORD, warlord.id, title, warlord.reason)
+
+
+def get_warlord_end_event(warlord: Warlord) -> TimelineEvent:
+    """
+    Gets the end event of a Warlord term, either expired or revoked
+    :param warlord: The Warlord
+    :return: The event
+    """
+
+    if warlord.end_date < warlord.original_end_date:
+        return TimelineEvent(warlord.end_date, SOURCE_WARLORD, warlord.id, "Warlord title revoked",
+                             warlord.revoke_reason)
+
+    return TimelineEvent(warlord.end_date, SOURCE_WARLORD, warlord.id, "Warlord term ended")
+
+
+def get_devil_fruit_collection_event(devil_fruit: DevilFruit) -> TimelineEvent:
+    """
+    Gets the collection event of a Devil Fruit
+    :param devil_fruit: The Devil Fruit
+    :return: The event
+    """
+
+    return TimelineEvent(devil_fruit.collection_date, SOURCE_DEVIL_FRUIT, devil_fruit.id,
+                         f"Collected {devil_fruit.get_full_name()}")
+
+
+def get_devil_fruit_eaten_event(devil_fruit: DevilFruit) -> TimelineEvent:
+    """
+    Gets the eaten event of a Devil Fruit
+    :param devil_fruit: The Devil Fruit
+    :return: The event
+    """
+
+    return TimelineEvent(devil_fruit.eaten_date, SOURCE_DEVIL_FRUIT, devil_fruit.id,
+                         f"Ate {devil_fruit.get_full_name()}")
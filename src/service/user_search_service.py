@@ -0,0 +1,167 @@
+import threading
+import time
+
+import resources.Environment as Env
+from src.model.User import User
+from src.model.projection.UserListRow import UserListRow
+
+# Search results shared by all sessions, by normalised query: (search time, users)
+_results_cache: dict[str, tuple[float, list[UserListRow]]] = {}
+# Searches currently running, by normalised query
+_in_flight_searches: dict[str, threading.Event] = {}
+# Latest query of each search box, by search key: (search time, normalised query)
+_latest_queries: dict[str, tuple[float, str]] = {}
+_lock = threading.Lock()
+
+SEARCH_LIMIT = 10
+MAX_CACHED_SEARCHES = 1000
+# Seconds between two checks of a search box while waiting for a running search
+WAIT_CHECK_INTERVAL = 0.1
+
+
+def search_users(filter_by: str, search_key: str = None) -> list[UserListRow]:
+    """
+    Searches users by string filter, reusing the results of earlier searches for a while.
+    A search narrowing a cached query whose results were complete is answered from those results, and concurrent
+    searches of the same query wait for the running one instead of querying again, for USER_SEARCH_WAIT_TIMEOUT at
+    most before querying on their own. A search whose box has since been searched with another query stops waiting
+    :param filter_by: Filter by
+    :param search_key: The key of the search box, unique by session, None if searches are never superseded
+    :return: Users, empty if the search was superseded
+    """
+
+    query = normalise_query(filter_by)
+    if search_key is not None:
+        with _lock:
+            set_latest_query(search_key, query)
+
+    wait_until = time.monotonic() + Env.USER_SEARCH_WAIT_TIMEOUT.get_float()
+    while True:
+        with _lock:
+            users = get_cached_users(query)
+            if users is not None:
+                return users
+
+            if is_superseded(search_key, query):
+                return []
+
+            in_flight_search = _in_flight_searches.get(query)
+            if in_flight_search is None:
+                in_flight_search = _in_flight_searches[query] = threading.Event()
+                break
+
+        # Same query already running in another session, wait for its results
+        if time.monotonic() >= wait_until:
+            # Running for too long, query without waiting for it any more
+            return list(UserListRow.from_query(User.get_string_filter_query(query).limit(SEARCH_LIMIT)))
+
+        in_flight_search.wait(timeout=WAIT_CHECK_INTERVAL)
+
+    try:
+        users = list(UserListRow.from_query(User.get_string_filter_query(query).limit(SEARCH_LIMIT)))
+        with _lock:
+            cache_users(query, users)
+    finally:
+        with _lock:
+            _in_flight_searches.pop(query).set()
+
+    return list(users)
+
+
+def set_latest_query(search_key: str, query: str) -> None:
+    """
+    Sets the latest query of a search box, evicting the oldest search boxes when too many are tracked. Lock must be held
+    :param search_key: The key of the search box
+    :param query: The normalised query
+    :return: None
+    """
+
+    if len(_latest_queries) >= MAX_CACHED_SEARCHES:
+        for oldest_key in sorted(_latest_queries, key=lambda k: _latest_queries[k][0])[:MAX_CACHED_SEARCHES // 10]:
+            del _latest_queries[oldest_key]
+
+    _latest_queries[search_key] = (time.monotonic(), query)
+
+
+def is_superseded(search_key: str | None, query: str) -> bool:
+    """
+    Checks if the search box has since been searched with another query. Lock must be held
+    :param search_key: The key of the search box
+    :param query: The normalised query
+    :return: True if the search is superseded
+    """
+
+    if search_key is None or search_key not in _latest_queries:
+        return False
+
+    return _latest_queries[search_key][1] != query
+
+
+def normalise_query(filter_by: str) -> str:
+    """
+    Normalises a search query, so that equivalent queries share the same cache entry
+    :param filter_by: Filter by
+    :return: The normalised query
+    """
+
+    return " ".join(filter_by.split()).lower()
+
+
+def get_cached_users(query: str) -> list[UserListRow] | None:
+    """
+    Gets the users of a query from the cache, lock must be held
+    :param query: The normalised query
+    :return: The users, None if they can't be answered from the cache
+    """
+
+    expired_before = time.monotonic() - Env.USER_SEARCH_CACHE_TTL.get_int()
+
+    cached = _results_cache.get(query)
+    if cached is not None and cached[0] > expired_before:
+        return list(cached[1])
+
+    # Id searches are exact matches, so their results can't be narrowed
+    if query.isdigit():
+        return None
+
+    # Results of a shorter prefix of the query, if they were complete they contain all the results of the query
+    for prefix_length in range(len(query) - 1, 1, -1):
+        prefix = query[:prefix_length]
+        cached = _results_cache.get(prefix)
+        if (cached is None or cached[0] <= expired_before or len(cached[1]) >= SEARCH_LIMIT or prefix.isdigit()
+                or prefix.startswith("@") != query.startswith("@")):
+            continue
+
+        return [user for user in cached[1] if is_match(user, query)]
+
+    return None
+
+
+def is_match(user: UserListRow, query: str) -> bool:
+    """
+    Checks if a user matches a query the same way the database search does
+    :param user: The user
+    :param query: The normalised query
+    :return: True if the user matches
+    """
+
+    if query.startswith("@"):
+        return user.tg_username is not None and user.tg_username.lower().startswith(query[1:])
+
+    return any(value is not None and query in value.lower()
+               for value in (user.tg_first_name, user.tg_last_name, user.tg_username))
+
+
+def cache_users(query: str, users: list[UserListRow]) -> None:
+    """
+    Caches the users of a query, evicting the oldest searches when the cache is full. Lock must be held
+    :param query: The normalised query
+    :param users: The users
+    :return: None
+    """
+
+    if len(_results_cache) >= MAX_CACHED_SEARCHES:
+        for oldest_query in sorted(_results_cache, key=lambda q: _results_cache[q][0])[:MAX_CACHED_SEARCHES // 10]:
+            del _results_cache[oldest_query]
+
+    _results_cache[query] = (time.monotonic(), users)
@@ -0,0 +1,87 @@
+import datetime
+
+import streamlit as st
+from peewee import fn, Field
+
+import resources.Environment as Env
+from src.model.Crew import Crew
+from src.model.DevilFruit import DevilFruit
+from src.model.User import User
+from src.model.Warlord import Warlord
+from src.model.filter.UserFilter import UserFilter
+from src.model.projection.UserListRow import UserListRow
+
+FACET_FIELDS: dict[str, Field] = {
+    UserFilter.CREW: User.crew,
+    UserFilter.LOCATION_LEVEL: User.location_level,
+    UserFilter.IS_ACTIVE: User.is_active,
+    UserFilter.IS_ADMIN: User.is_admin
+}
+
+
+def get_status_badges(users: list[UserListRow]) -> dict[int, list[str]]:
+    """
+    Gets the status badges of a list of users: warlord, arrested, crew and owned devil fruits.
+    Each relation is loaded with a single query for the whole list, so the number of queries does not depend on the
+    number of users
+    :param users: The users
+    :return: The badges, by user id
+    """
+
+    badges: dict[int, list[str]] = {user.id: [] for user in users}
+    if len(badges) == 0:
+        return badges
+
+    user_ids = list(badges.keys())
+
+    # Warlords
+    warlord_user_ids: set[int] = {user_id for (user_id,) in (
+        Warlord.select(Warlord.user)
+        .where((Warlord.user.in_(user_ids)) & (Warlord.end_date > datetime.datetime.now()))
+        .tuples())}
+
+    # Crews
+    crew_ids = {user.crew_id for user in users if user.crew_id is not None}
+    crew_names: dict[int, str] = {}
+    if len(crew_ids) > 0:
+        crew_names = {crew_id: name for crew_id, name in (
+            Crew.select(Crew.id, Crew.name).where(Crew.id.in_(crew_ids)).tuples())}
+
+    # Owned devil fruits
+    devil_fruit_names: dict[int, list[str]] = {}
+    for devil_fruit in (DevilFruit.select(DevilFruit.owner, DevilFruit.name, DevilFruit.model)
+                        .where(DevilFruit.owner.in_(user_ids))):
+        devil_fruit_names.setdefault(devil_fruit.owner_id, []).append(devil_fruit.get_full_name())
+
+    for user in users:
+        user_badges = badges[user.id]
+
+        if user.id in warlord_user_ids:
+            user_badges.append("⚔ Warlord")
+
+        if user.is_arrested():
+            user_badges.append("⛓ Arrested" + (" (permanent)" if user.impel_down_is_permanent else ""))
+
+        if user.crew_id in crew_names:
+            user_badges.append(f"🏴‍☠️ {crew_names[user.crew_id]}")
+
+        for devil_fruit_name in devil_fruit_names.get(user.id, []):
+            user_badges.append(f"🍎 {devil_fruit_name}")
+
+    return badges
+
+
+@st.cache_data(ttl=Env.USER_FACET_CACHE_TTL.get_int(), show_spinner=False)
+def get_facet_counts(user_filter: UserFilter, facet: str) -> dict[any, int]:
+    """
+    Gets the number of users by value of a facet with a single grouped query.
+    The conditions on the facet itself are left out, so that the counts show how many users each value would match
+    :param user_filter: The user filter
+    :param facet: The facet, one of FACET_FIELDS
+    :return: The number of users by facet value
+    """
+
+    field = FACET_FIELDS[facet]
+    query = user_filter.apply(User.select(field, fn.COUNT(User.id)), excluded_facet=facet).group_by(field).tuples()
+
+    return {value: count for value, count in query}